@@ -1,6 +1,73 @@
 """Entry point for running as a module: python -m cal_exporter"""
 
-from cal_exporter.cli import main
+import sys
 
-if __name__ == "__main__":
+from cal_exporter import __version__
+
+# Answered without importing click or the CLI module. Keep in sync with the
+# options declared on cal_exporter.cli.main.
+STATIC_HELP = """\
+Usage: cal-exporter [OPTIONS]
+
+  Export Google Calendar events filtered by hashtags.
+
+  Examples:
+
+  # Export today's events with #billable tag to terminal
+  cal-exporter -c "https://calendar.google.com/.../basic.ics" -s "#billable"
+
+  # Load a local .ics file
+  cal-exporter -l calendar.ics -s "#billable"
+
+  # Export date range to Excel
+  cal-exporter -c "primary" -d "2026-02-01:2026-02-28" -s "#project" -w report.xlsx -e xlsx
+
+  # Use Google Calendar API with credentials file
+  cal-exporter -c "primary" -g ~/credentials.json -s "#work"
+
+Options:
+  -c, --calendar TEXT             Google Calendar public iCal URL or Calendar
+                                  ID for API access.
+  -l, --local PATH                Path to a local .ics file to load.
+  -s, --search TEXT               Hashtags to filter by. Comma-separated = AND
+                                  logic, multiple -s = OR logic. Example: -s
+                                  '#zzp, #work' requires both; -s '#zzp' -s
+                                  '#work' requires either.
+  -d, --date TEXT                 Date filter: single date (YYYY-MM-DD), range
+                                  (YYYY-MM-DD:YYYY-MM-DD), or 'today'.
+                                  Supports time: YYYY-MM-DDTHH:MM
+  -w, --write PATH                Output file path to write results to.
+  -e, --export [pdf|xlsx|ods|csv|json]
+                                  Export format (required when using -w).
+                                  Repeat to export several formats; each is
+                                  written to the -w path with its own
+                                  extension.
+  --pretty                        Indent JSON output (compact by default).
+  -t, --terminal                  Output results to terminal (default if no -w
+                                  specified).
+  -g, --credentials PATH          Path to Google API OAuth credentials.json
+                                  file (for Google Calendar API access).
+  --version                       Show the version and exit.
+  -h, --help                      Show this message and exit.
+"""
+
+HELP_FLAGS = {"--help", "-h"}
+VERSION_FLAGS = {"--version"}
+
+
+def run() -> None:
+    """Console-script entry point that answers --help/--version before loading the CLI."""
+    args = sys.argv[1:]
+    if not args or args[0] in HELP_FLAGS:
+        sys.stdout.write(STATIC_HELP)
+        sys.exit(0)
+    if args[0] in VERSION_FLAGS:
+        sys.stdout.write(f"cal-exporter, version {__version__}\n")
+        sys.exit(0)
+
+    from cal_exporter.cli import main
     main()
+
+
+if __name__ == "__main__":
+    run()
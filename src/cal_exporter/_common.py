@@ -0,0 +1,31 @@
+"""Values and helpers shared across the package."""
+
+import re
+from typing import List, Optional
+
+from dateutil.tz import tzlocal
+
+# Resolved once; tzlocal() inspects the system timezone on every call.
+# Sharing one instance also lets datetime comparisons between fetched events
+# and parsed date ranges skip utcoffset() calls (same tzinfo object).
+LOCAL_TZ = tzlocal()
+
+# Hashtags: # followed by word characters (\w is already case-agnostic)
+_HASHTAG_RE = re.compile(r"#\w+")
+
+
+def extract_hashtags(text: Optional[str]) -> List[str]:
+    """
+    Extract hashtags from text.
+    
+    Args:
+        text: Text to search for hashtags
+        
+    Returns:
+        List of hashtags found (including the # symbol), lowercased
+    """
+    # Most descriptions carry no hashtags; a substring check skips the regex
+    if not text or "#" not in text:
+        return []
+    # Matching is case-insensitive everywhere, so normalize case once here
+    return [tag.lower() for tag in _HASHTAG_RE.findall(text)]
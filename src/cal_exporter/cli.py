@@ -1,29 +1,26 @@
 """Command-line interface for the calendar exporter."""
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
 import click
 
-from cal_exporter.fetchers import ICalFetcher, LocalICalFetcher, get_google_api_fetcher
-from cal_exporter.filters import filter_events, parse_date_range
-from cal_exporter.exporters import (
-    get_terminal_exporter,
-    get_csv_exporter,
-    get_json_exporter,
-    get_xlsx_exporter,
-    get_ods_exporter,
-    get_pdf_exporter,
-)
+# Fetchers, filters and exporters are imported where they are used so that
+# --help and argument errors never pay for icalendar, requests, reportlab, etc.
+
+# http(s) URL that looks like an iCal feed (.ics file or "ical" in the path)
+_ICAL_URL_RE = re.compile(r"^https?://.*(?:\.ics|ical)", re.IGNORECASE)
 
 
 def get_fetcher(calendar: str, credentials: Optional[str] = None):
     """Determine the appropriate fetcher based on the calendar source."""
+    from cal_exporter.fetchers import ICalFetcher, get_google_api_fetcher
+    
     # Check if it's an iCal URL
-    if calendar.startswith(("http://", "https://")) and (
-        ".ics" in calendar or "ical" in calendar.lower()
-    ):
+    if _ICAL_URL_RE.match(calendar):
         return ICalFetcher(calendar)
     
     # Otherwise, treat as Google Calendar ID
@@ -38,19 +35,23 @@ def get_fetcher(calendar: str, credentials: Optional[str] = None):
         ) from e
 
 
-def get_exporter(export_format: str, output_path: Optional[str]):
+def get_exporter(export_format: str, output_path: Optional[str], pretty: bool = False):
     """Get the appropriate exporter based on format."""
-    exporter_getters = {
-        "csv": get_csv_exporter,
-        "json": get_json_exporter,
-        "xlsx": get_xlsx_exporter,
-        "ods": get_ods_exporter,
-        "pdf": get_pdf_exporter,
+    import cal_exporter.exporters as exporters
+    
+    exporter_classes = {
+        "csv": "CSVExporter",
+        "json": "JSONExporter",
+        "xlsx": "XLSXExporter",
+        "ods": "ODSExporter",
+        "pdf": "PDFExporter",
     }
     
-    if export_format in exporter_getters:
+    if export_format in exporter_classes:
         try:
-            ExporterClass = exporter_getters[export_format]()
+            ExporterClass = getattr(exporters, exporter_classes[export_format])
+            if export_format == "json":
+                return ExporterClass(output_path, pretty=pretty)
             return ExporterClass(output_path)
         except ImportError as e:
             raise ImportError(f"Export format '{export_format}' is not available: {e}")
@@ -58,7 +59,22 @@ def get_exporter(export_format: str, output_path: Optional[str]):
     return None
 
 
-@click.command()
+def run_export(exporter, export_format: str, events) -> None:
+    """Run an exporter; its backend library (openpyxl, reportlab, odfpy) is imported here."""
+    try:
+        exporter.export(events)
+    except ImportError as e:
+        raise ImportError(f"Export format '{export_format}' is not available: {e}")
+
+
+def get_output_path(write: str, export_format: str, multiple: bool) -> str:
+    """Get the output path for a format; with several formats each gets its own extension."""
+    if not multiple:
+        return write
+    return str(Path(write).with_suffix(f".{export_format}"))
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option(
     "-c", "--calendar",
     help="Google Calendar public iCal URL or Calendar ID for API access."
@@ -88,7 +104,15 @@ def get_exporter(export_format: str, output_path: Optional[str]):
 @click.option(
     "-e", "--export",
     type=click.Choice(["pdf", "xlsx", "ods", "csv", "json"], case_sensitive=False),
-    help="Export format (required when using -w)."
+    multiple=True,
+    help="Export format (required when using -w). Repeat to export several formats; "
+         "each is written to the -w path with its own extension."
+)
+@click.option(
+    "--pretty",
+    is_flag=True,
+    default=False,
+    help="Indent JSON output (compact by default)."
 )
 @click.option(
     "-t", "--terminal",
@@ -103,8 +127,8 @@ def get_exporter(export_format: str, output_path: Optional[str]):
 )
 @click.version_option(package_name="cal-exporter")
 def main(calendar: Optional[str], local: Optional[str], search: Tuple[str, ...], 
-         date: str, write: Optional[str], export: Optional[str], terminal: bool,
-         credentials: Optional[str]):
+         date: str, write: Optional[str], export: Tuple[str, ...], pretty: bool,
+         terminal: bool, credentials: Optional[str]):
     """
     Export Google Calendar events filtered by hashtags.
     
@@ -139,7 +163,7 @@ def main(calendar: Optional[str], local: Optional[str], search: Tuple[str, ...],
         path = Path(write)
         ext = path.suffix.lower().lstrip(".")
         if ext in ["pdf", "xlsx", "ods", "csv", "json"]:
-            export = ext
+            export = (ext,)
         else:
             raise click.UsageError(
                 "When using -w/--write, you must specify -e/--export format "
@@ -151,12 +175,15 @@ def main(calendar: Optional[str], local: Optional[str], search: Tuple[str, ...],
         terminal = True
     
     try:
+        from cal_exporter.filters import filter_events, parse_date_range
+        
         # Parse date range
         start_date, end_date = parse_date_range(date)
         click.echo(f"Filtering events from {start_date} to {end_date}", err=True)
         
         # Get the appropriate fetcher
         if local:
+            from cal_exporter.fetchers import LocalICalFetcher
             fetcher = LocalICalFetcher(local)
             click.echo(f"Loading events from local file: {local}", err=True)
         else:
@@ -178,14 +205,27 @@ def main(calendar: Optional[str], local: Optional[str], search: Tuple[str, ...],
         
         # Export to file if specified
         if write and export:
-            exporter = get_exporter(export.lower(), write)
-            if exporter:
-                exporter.export(events)
-                click.echo(f"Exported to {write}", err=True)
+            formats = list(dict.fromkeys(fmt.lower() for fmt in export))
+            targets = []
+            for export_format in formats:
+                output_path = get_output_path(write, export_format, len(formats) > 1)
+                exporter = get_exporter(export_format, output_path, pretty=pretty)
+                if exporter:
+                    targets.append((exporter, export_format, output_path))
+            
+            if len(targets) == 1:
+                run_export(targets[0][0], targets[0][1], events)
+            else:
+                # Exporters are independent; run them side by side
+                with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+                    list(pool.map(lambda target: run_export(target[0], target[1], events), targets))
+            
+            for _, _, output_path in targets:
+                click.echo(f"Exported to {output_path}", err=True)
         
         # Output to terminal
         if terminal:
-            TerminalExporter = get_terminal_exporter()
+            from cal_exporter.exporters import TerminalExporter
             terminal_exporter = TerminalExporter()
             terminal_exporter.export(events)
             
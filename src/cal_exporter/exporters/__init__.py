@@ -1,45 +1,61 @@
 """Export modules for various output formats."""
 
-# Lazy imports to avoid breaking the CLI if some libraries have issues
+from importlib import import_module
+
+# Lazy imports to avoid breaking the CLI if some libraries have issues, and
+# to keep heavy backends (rich, openpyxl, odfpy, reportlab) out of startup.
+# Exporter classes are resolved on first attribute access (PEP 562).
+_EXPORTERS = {
+    "TerminalExporter": "terminal",
+    "CSVExporter": "csv_export",
+    "JSONExporter": "json_export",
+    "XLSXExporter": "xlsx_export",
+    "ODSExporter": "ods_export",
+    "PDFExporter": "pdf_export",
+}
+
+
+def __getattr__(name):
+    """Import an exporter class from its module on first access."""
+    if name in _EXPORTERS:
+        exporter_class = getattr(import_module(f".{_EXPORTERS[name]}", __name__), name)
+        globals()[name] = exporter_class
+        return exporter_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_terminal_exporter():
     """Get TerminalExporter class."""
-    from .terminal import TerminalExporter
-    return TerminalExporter
+    return __getattr__("TerminalExporter")
 
 
 def get_csv_exporter():
     """Get CSVExporter class."""
-    from .csv_export import CSVExporter
-    return CSVExporter
+    return __getattr__("CSVExporter")
 
 
 def get_json_exporter():
     """Get JSONExporter class."""
-    from .json_export import JSONExporter
-    return JSONExporter
+    return __getattr__("JSONExporter")
 
 
 def get_xlsx_exporter():
     """Get XLSXExporter class."""
-    from .xlsx_export import XLSXExporter
-    return XLSXExporter
+    return __getattr__("XLSXExporter")
 
 
 def get_ods_exporter():
     """Get ODSExporter class."""
-    from .ods_export import ODSExporter
-    return ODSExporter
+    return __getattr__("ODSExporter")
 
 
 def get_pdf_exporter():
     """Get PDFExporter class."""
-    from .pdf_export import PDFExporter
-    return PDFExporter
+    return __getattr__("PDFExporter")
 
 
 __all__ = [
+    *_EXPORTERS,
     "get_terminal_exporter",
     "get_csv_exporter",
     "get_json_exporter",
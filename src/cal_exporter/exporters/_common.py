@@ -0,0 +1,40 @@
+"""Shared helpers for the file exporters."""
+
+from typing import List, Tuple
+
+from cal_exporter.models import CalendarEvent
+
+# Buffer size for text/JSON file writers; large exports issue far fewer writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Column order of the tuples returned by format_rows (CalendarEvent.to_row_tuple)
+ROW_FIELDS = (
+    "date",
+    "start_time",
+    "end_time",
+    "duration_hours",
+    "duration_formatted",
+    "summary",
+    "description",
+    "location",
+    "hashtags",
+)
+
+
+def format_rows(events: List[CalendarEvent]) -> Tuple[List[Tuple], float]:
+    """
+    Format each event once into a tuple of export values.
+    
+    Args:
+        events: List of calendar events to format
+        
+    Returns:
+        Tuple of (rows, total_hours): one tuple per event with values in
+        ROW_FIELDS order, and the unrounded sum of all event durations
+    """
+    rows = []
+    total_hours = 0.0
+    for e in events:
+        rows.append(e.to_row_tuple())
+        total_hours += e.duration_hours
+    return rows, total_hours
@@ -4,6 +4,7 @@ import csv
 from pathlib import Path
 from typing import List
 
+from cal_exporter.exporters._common import ROW_FIELDS, WRITE_BUFFER_SIZE, format_rows
 from cal_exporter.models import CalendarEvent
 
 
@@ -32,32 +33,10 @@ class CSVExporter:
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Define columns
-        fieldnames = [
-            "date",
-            "start_time",
-            "end_time",
-            "duration_hours",
-            "duration_formatted",
-            "summary",
-            "description",
-            "location",
-            "hashtags",
-        ]
-        
-        with open(self.output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for event in events:
-                writer.writerow({
-                    "date": event.start.strftime("%Y-%m-%d"),
-                    "start_time": event.start.strftime("%H:%M"),
-                    "end_time": event.end.strftime("%H:%M"),
-                    "duration_hours": round(event.duration_hours, 2),
-                    "duration_formatted": event.duration_formatted,
-                    "summary": event.summary,
-                    "description": event.description or "",
-                    "location": event.location or "",
-                    "hashtags": ", ".join(event.hashtags),
-                })
+        with open(
+            self.output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(ROW_FIELDS)
+            rows, _ = format_rows(events)
+            writer.writerows(rows)
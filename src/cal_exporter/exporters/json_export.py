@@ -1,23 +1,51 @@
 """JSON file exporter."""
 
 import json
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
+from cal_exporter.exporters._common import WRITE_BUFFER_SIZE
 from cal_exporter.models import CalendarEvent
 
+# orjson is optional; it is noticeably faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> str:
+    """Encode datetimes for the stdlib encoder the way orjson does."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
 
 class JSONExporter:
     """Export events to JSON file format."""
     
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: str, pretty: bool = False):
         """
         Initialize the JSON exporter.
         
         Args:
             output_path: Path to the output JSON file
+            pretty: Indent the output instead of writing compact JSON
         """
         self.output_path = Path(output_path)
+        self.pretty = pretty
     
     def export(self, events: List[CalendarEvent]) -> None:
         """
@@ -29,14 +57,35 @@ class JSONExporter:
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert events to dictionaries
-        data = {
-            "events": [event.to_dict() for event in events],
-            "summary": {
-                "total_events": len(events),
-                "total_hours": round(sum(e.duration_hours for e in events), 2),
+        if self.pretty:
+            event_dicts = []
+            total_hours = 0.0
+            for event in events:
+                event_dicts.append(event.to_jsonable())
+                total_hours += event.duration_hours
+            data = {
+                "events": event_dicts,
+                "summary": {
+                    "total_events": len(events),
+                    "total_hours": round(total_hours, 2),
+                }
             }
-        }
+            with open(self.output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(_dumps(data, pretty=True))
+            return
         
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Stream events one at a time instead of building the whole document
+        total_hours = 0.0
+        with open(self.output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{"events":[')
+            for i, event in enumerate(events):
+                if i:
+                    f.write(b",")
+                f.write(_dumps(event.to_jsonable()))
+                total_hours += event.duration_hours
+            f.write(b'],"summary":')
+            f.write(_dumps({
+                "total_events": len(events),
+                "total_hours": round(total_hours, 2),
+            }))
+            f.write(b"}")
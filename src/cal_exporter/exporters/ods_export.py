@@ -1,10 +1,9 @@
-"""OpenDocument Spreadsheet (ODS) file exporter using pyexcel-ods3."""
+"""OpenDocument Spreadsheet (ODS) file exporter using odfpy."""
 
 from pathlib import Path
 from typing import List
 
-from pyexcel_ods3 import save_data
-
+from cal_exporter.exporters._common import format_rows
 from cal_exporter.models import CalendarEvent
 
 
@@ -27,6 +26,11 @@ class ODSExporter:
         Args:
             events: List of calendar events to export
         """
+        from odf.opendocument import OpenDocumentSpreadsheet
+        from odf.table import Table, TableRow, TableCell
+        from odf.teletype import addTextToElement
+        from odf.text import P
+        
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -44,27 +48,36 @@ class ODSExporter:
         ]
         
         # Build data rows
+        data_rows, total_hours = format_rows(events)
         rows = [headers]
+        rows.extend(data_rows)
         
-        for event in events:
-            row = [
-                event.start.strftime("%Y-%m-%d"),
-                event.start.strftime("%H:%M"),
-                event.end.strftime("%H:%M"),
-                round(event.duration_hours, 2),
-                event.duration_formatted,
-                event.summary,
-                event.description or "",
-                event.location or "",
-                ", ".join(event.hashtags),
-            ]
-            rows.append(row)
-        
-        # Add empty row and summary
-        rows.append([])
+        # Add empty row (a table row needs at least one cell) and summary
+        rows.append([None])
         rows.append(["Total Events:", len(events)])
-        rows.append(["Total Hours:", round(sum(e.duration_hours for e in events), 2)])
+        rows.append(["Total Hours:", round(total_hours, 2)])
+        
+        # Write the sheet directly with odfpy
+        doc = OpenDocumentSpreadsheet()
+        table = Table(name="Calendar Events")
+        for row in rows:
+            table_row = TableRow()
+            for value in row:
+                if value is None:
+                    table_row.addElement(TableCell())
+                    continue
+                if isinstance(value, (int, float)):
+                    cell = TableCell(valuetype="float", value=str(value))
+                else:
+                    cell = TableCell(valuetype="string")
+                # Line breaks, tabs and repeated spaces need their own
+                # elements; ODF collapses them in plain paragraph text
+                paragraph = P()
+                addTextToElement(paragraph, str(value))
+                cell.addElement(paragraph)
+                table_row.addElement(cell)
+            table.addElement(table_row)
+        doc.spreadsheet.addElement(table)
         
         # Save to ODS file
-        data = {"Calendar Events": rows}
-        save_data(str(self.output_path), data)
+        doc.save(str(self.output_path))
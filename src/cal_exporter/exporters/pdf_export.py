@@ -3,15 +3,62 @@
 from pathlib import Path
 from typing import List
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-
+from cal_exporter.exporters._common import format_rows
 from cal_exporter.models import CalendarEvent
 
 
+# Stylesheets are built on first export and shared by later exports
+_STYLES = None
+_TABLE_STYLE = None
+_SUMMARY_STYLE = None
+
+
+def _get_styles():
+    """Return the sample stylesheet, table style and summary style, building them once."""
+    global _STYLES, _TABLE_STYLE, _SUMMARY_STYLE
+    
+    if _STYLES is None:
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import TableStyle
+        
+        styles = getSampleStyleSheet()
+        table_style = TableStyle([
+            # Header style
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+            ("TOPPADDING", (0, 0), (-1, 0), 8),
+            
+            # Body style
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), 9),
+            ("ALIGN", (0, 1), (3, -1), "CENTER"),  # Center date/time columns
+            ("ALIGN", (3, 1), (3, -1), "RIGHT"),  # Right align hours
+            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+            ("TOPPADDING", (0, 1), (-1, -1), 6),
+            
+            # Alternating row colors
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
+            
+            # Grid
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ])
+        _SUMMARY_STYLE = ParagraphStyle(
+            "Summary",
+            parent=styles["Normal"],
+            fontName="Helvetica-Bold",
+            fontSize=11,
+        )
+        _TABLE_STYLE = table_style
+        _STYLES = styles
+    
+    return _STYLES, _TABLE_STYLE, _SUMMARY_STYLE
+
+
 class PDFExporter:
     """Export events to PDF file format."""
     
@@ -31,6 +78,10 @@ class PDFExporter:
         Args:
             events: List of calendar events to export
         """
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+        
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -45,7 +96,7 @@ class PDFExporter:
         )
         
         # Get styles
-        styles = getSampleStyleSheet()
+        styles, table_style, summary_style = _get_styles()
         title_style = styles["Heading1"]
         
         # Create content elements
@@ -68,66 +119,28 @@ class PDFExporter:
         # Build table data
         table_data = [headers]
         
-        for event in events:
-            row = [
-                event.start.strftime("%Y-%m-%d"),
-                event.start.strftime("%H:%M"),
-                event.end.strftime("%H:%M"),
-                f"{event.duration_hours:.2f}",
-                self._truncate(event.summary, 50),
-                self._truncate(", ".join(event.hashtags), 30),
-            ]
-            table_data.append(row)
+        rows, total_hours = format_rows(events)
+        for date, start, end, hours, _, summary, _, _, hashtags in rows:
+            # Truncate long text with an ellipsis to keep rows on one line
+            if len(summary) > 50:
+                summary = summary[:47] + "..."
+            if len(hashtags) > 30:
+                hashtags = hashtags[:27] + "..."
+            table_data.append([date, start, end, f"{hours:.2f}", summary, hashtags])
         
         # Create table
         col_widths = [1 * inch, 0.7 * inch, 0.7 * inch, 0.7 * inch, 4 * inch, 2 * inch]
         table = Table(table_data, colWidths=col_widths)
         
         # Style the table
-        table.setStyle(TableStyle([
-            # Header style
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 10),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-            ("TOPPADDING", (0, 0), (-1, 0), 8),
-            
-            # Body style
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("FONTSIZE", (0, 1), (-1, -1), 9),
-            ("ALIGN", (0, 1), (3, -1), "CENTER"),  # Center date/time columns
-            ("ALIGN", (3, 1), (3, -1), "RIGHT"),  # Right align hours
-            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-            ("TOPPADDING", (0, 1), (-1, -1), 6),
-            
-            # Alternating row colors
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
-            
-            # Grid
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
+        table.setStyle(table_style)
         
         elements.append(table)
         elements.append(Spacer(1, 0.25 * inch))
         
         # Add summary
-        total_hours = sum(e.duration_hours for e in events)
-        summary_style = ParagraphStyle(
-            "Summary",
-            parent=styles["Normal"],
-            fontName="Helvetica-Bold",
-            fontSize=11,
-        )
         elements.append(Paragraph(f"Total Events: {len(events)}", summary_style))
         elements.append(Paragraph(f"Total Hours: {total_hours:.2f}", summary_style))
         
         # Build PDF
         doc.build(elements)
-    
-    def _truncate(self, text: str, max_length: int) -> str:
-        """Truncate text to max length with ellipsis."""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length - 3] + "..."
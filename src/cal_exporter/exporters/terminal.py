@@ -1,27 +1,58 @@
 """Terminal output exporter using rich for formatted tables."""
 
+import sys
 from typing import List
 
-from rich.console import Console
-from rich.table import Table
-
 from cal_exporter.models import CalendarEvent
 
+# Characters replaced with a space in tab-separated output
+_TSV_ESCAPES = str.maketrans("\t\r\n", "   ")
+
 
 class TerminalExporter:
     """Export events to terminal with formatted table output."""
     
     def __init__(self):
         """Initialize the terminal exporter."""
-        self.console = Console()
+        # Created on first export; rich is only imported when actually printing
+        self.console = None
     
     def export(self, events: List[CalendarEvent]) -> None:
         """
         Export events to the terminal as a formatted table.
         
+        When stdout is not a terminal (piped or redirected), plain
+        tab-separated lines are written instead (totals on stderr) and rich
+        is never loaded.
+        
         Args:
             events: List of calendar events to display
         """
+        headers = ["Date", "Time", "Duration", "Summary", "Hashtags"]
+        
+        # Build rows
+        rows = []
+        total_hours = 0.0
+        for event in events:
+            rows.append((
+                event.date_str,
+                f"{event.start_str} - {event.end_str}",
+                event.duration_formatted,
+                event.summary,
+                event.hashtag_str,
+            ))
+            total_hours += event.duration_hours
+        
+        if self.console is None and not sys.stdout.isatty():
+            self._write_plain(headers, rows, total_hours)
+            return
+        
+        from rich.console import Console
+        from rich.table import Table
+        
+        if self.console is None:
+            self.console = Console()
+        
         if not events:
             self.console.print("[yellow]No events to display.[/yellow]")
             return
@@ -34,29 +65,15 @@ class TerminalExporter:
         )
         
         # Add columns
-        table.add_column("Date", style="green", no_wrap=True)
-        table.add_column("Time", style="green", no_wrap=True)
-        table.add_column("Duration", style="yellow", justify="right")
-        table.add_column("Summary", style="white")
-        table.add_column("Hashtags", style="magenta")
+        table.add_column(headers[0], style="green", no_wrap=True)
+        table.add_column(headers[1], style="green", no_wrap=True)
+        table.add_column(headers[2], style="yellow", justify="right")
+        table.add_column(headers[3], style="white")
+        table.add_column(headers[4], style="magenta")
         
         # Add rows
-        total_hours = 0.0
-        for event in events:
-            date_str = event.start.strftime("%Y-%m-%d")
-            time_str = f"{event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}"
-            duration = event.duration_formatted
-            hashtags = ", ".join(event.hashtags) if event.hashtags else ""
-            
-            table.add_row(
-                date_str,
-                time_str,
-                duration,
-                event.summary,
-                hashtags,
-            )
-            
-            total_hours += event.duration_hours
+        for row in rows:
+            table.add_row(*row)
         
         # Print table
         self.console.print(table)
@@ -65,3 +82,23 @@ class TerminalExporter:
         self.console.print()
         self.console.print(f"[bold]Total events:[/bold] {len(events)}")
         self.console.print(f"[bold]Total hours:[/bold] {total_hours:.2f}")
+    
+    def _write_plain(self, headers: List[str], rows: List[tuple], total_hours: float) -> None:
+        """
+        Write rows as tab-separated lines for non-interactive output.
+        
+        Only the header and event rows go to stdout, so it stays valid TSV;
+        the totals go to stderr next to the CLI's status messages.
+        """
+        if not rows:
+            sys.stderr.write("No events to display.\n")
+            return
+        
+        write = sys.stdout.write
+        write("\t".join(headers) + "\n")
+        for row in rows:
+            # A tab or line break inside a value would split the row
+            write("\t".join(value.translate(_TSV_ESCAPES) for value in row) + "\n")
+        
+        sys.stderr.write(f"Total events: {len(rows)}\n")
+        sys.stderr.write(f"Total hours: {total_hours:.2f}\n")
@@ -3,12 +3,12 @@
 from pathlib import Path
 from typing import List
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
+from cal_exporter.exporters._common import format_rows
 from cal_exporter.models import CalendarEvent
 
+# Exports with at least this many events use openpyxl's write-only mode
+WRITE_ONLY_THRESHOLD = 500
+
 
 class XLSXExporter:
     """Export events to Excel XLSX file format."""
@@ -29,24 +29,46 @@ class XLSXExporter:
         Args:
             events: List of calendar events to export
         """
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+        from openpyxl.utils import get_column_letter
+        
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Large exports stream rows to disk instead of building the cell grid
+        write_only = len(events) >= WRITE_ONLY_THRESHOLD
+        
         # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Calendar Events"
-        
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
+        if write_only:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Calendar Events")
+        else:
+            wb = Workbook()
+            ws = wb.active
+            ws.title = "Calendar Events"
+        
+        # Register named styles once; cells then reference them by name
         thin_border = Border(
             left=Side(style="thin"),
             right=Side(style="thin"),
             top=Side(style="thin"),
             bottom=Side(style="thin"),
         )
+        wb.add_named_style(NamedStyle(
+            name="header",
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=thin_border,
+        ))
+        wb.add_named_style(NamedStyle(name="data", border=thin_border))
+        wb.add_named_style(NamedStyle(
+            name="data_number",
+            border=thin_border,
+            alignment=Alignment(horizontal="right"),
+        ))
+        wb.add_named_style(NamedStyle(name="label", font=Font(bold=True)))
         
         # Define headers
         headers = [
@@ -61,45 +83,65 @@ class XLSXExporter:
             "Hashtags",
         ]
         
+        # Auto-adjust column widths (write-only sheets need them before any row)
+        column_widths = [12, 10, 10, 12, 10, 40, 50, 30, 30]
+        for col, width in enumerate(column_widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        
+        rows, total_hours = format_rows(events)
+        
+        if write_only:
+            self._write_streaming(ws, headers, rows, total_hours)
+        else:
+            self._write_standard(ws, headers, rows, total_hours)
+        
+        # Save workbook
+        wb.save(self.output_path)
+    
+    def _write_standard(self, ws, headers, rows, total_hours) -> None:
+        """Write headers, rows and summary into a regular in-memory worksheet."""
         # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
+        ws.append(headers)
+        for cell in ws[1]:
+            cell.style = "header"
         
         # Write data rows
-        for row, event in enumerate(events, 2):
-            data = [
-                event.start.strftime("%Y-%m-%d"),
-                event.start.strftime("%H:%M"),
-                event.end.strftime("%H:%M"),
-                round(event.duration_hours, 2),
-                event.duration_formatted,
-                event.summary,
-                event.description or "",
-                event.location or "",
-                ", ".join(event.hashtags),
-            ]
-            
-            for col, value in enumerate(data, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.border = thin_border
-                if col == 4:  # Duration hours - right align numbers
-                    cell.alignment = Alignment(horizontal="right")
+        for row in rows:
+            ws.append(row)
+        
+        # Style data rows in a second pass; duration hours are right aligned
+        for row in ws.iter_rows(min_row=2, max_row=len(rows) + 1, max_col=len(headers)):
+            for cell in row:
+                cell.style = "data"
+            row[3].style = "data_number"
         
         # Add summary row
-        summary_row = len(events) + 3
-        ws.cell(row=summary_row, column=1, value="Total Events:").font = Font(bold=True)
-        ws.cell(row=summary_row, column=2, value=len(events))
-        ws.cell(row=summary_row + 1, column=1, value="Total Hours:").font = Font(bold=True)
-        ws.cell(row=summary_row + 1, column=2, value=round(sum(e.duration_hours for e in events), 2))
+        summary_row = len(rows) + 3
+        ws.cell(row=summary_row, column=1, value="Total Events:").style = "label"
+        ws.cell(row=summary_row, column=2, value=len(rows))
+        ws.cell(row=summary_row + 1, column=1, value="Total Hours:").style = "label"
+        ws.cell(row=summary_row + 1, column=2, value=round(total_hours, 2))
+    
+    def _write_streaming(self, ws, headers, rows, total_hours) -> None:
+        """Append headers, rows and summary to a write-only worksheet."""
+        from openpyxl.cell import WriteOnlyCell
         
-        # Auto-adjust column widths
-        column_widths = [12, 10, 10, 12, 10, 40, 50, 30, 30]
-        for col, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col)].width = width
+        def styled(value, style):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            return cell
         
-        # Save workbook
-        wb.save(self.output_path)
+        # Write headers
+        ws.append([styled(header, "header") for header in headers])
+        
+        # Write data rows
+        for row in rows:
+            ws.append([
+                styled(value, "data_number" if col == 4 else "data")
+                for col, value in enumerate(row, 1)
+            ])
+        
+        # Add summary row
+        ws.append([])
+        ws.append([styled("Total Events:", "label"), len(rows)])
+        ws.append([styled("Total Hours:", "label"), round(total_hours, 2)])
@@ -1,7 +1,7 @@
 """Calendar fetchers for iCal and Google Calendar API."""
 
-from .ical import ICalFetcher
-from .local_ical import LocalICalFetcher
+from .ical import ICalFetcher, fetch_all
+from .local_ical import LocalICalFetcher, MultiFileFetcher
 
 # Lazy import for GoogleAPIFetcher to avoid cryptography issues
 def get_google_api_fetcher():
@@ -9,4 +9,4 @@ def get_google_api_fetcher():
     from .google_api import GoogleAPIFetcher
     return GoogleAPIFetcher
 
-__all__ = ["ICalFetcher", "LocalICalFetcher", "get_google_api_fetcher"]
+__all__ = ["ICalFetcher", "LocalICalFetcher", "MultiFileFetcher", "fetch_all", "get_google_api_fetcher"]
@@ -0,0 +1,426 @@
+"""Helpers shared by the iCal URL and local file fetchers."""
+
+import codecs
+import re
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from itertools import chain
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from icalendar import Event, Timezone
+
+from cal_exporter._common import LOCAL_TZ as _LOCAL_TZ
+from cal_exporter.models import CalendarEvent
+
+# Default duration for events without an end time
+_ONE_HOUR = timedelta(hours=1)
+
+# The VEVENT properties the parsers read; pass to iter_vevent_blocks to drop the rest
+EVENT_PROPERTIES = frozenset(
+    {b"SUMMARY", b"DTSTART", b"DTEND", b"DESCRIPTION", b"LOCATION", b"UID"}
+)
+
+# DTSTART/DTEND values are compared by their raw date before timezone
+# resolution; UTC offsets span 26 hours (UTC-12 to UTC+14), so the slack
+# between the feed's zone and the local one must cover two days
+_DATE_SLACK = timedelta(days=2)
+
+# TZID parameter values (possibly quoted) in a raw VEVENT block
+_TZID_PARAM_RE = re.compile(rb';TZID="?([^";:]*)', re.IGNORECASE)
+
+
+def iter_vevent_blocks(
+    data: Union[bytes, Iterable[bytes]],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    properties: Optional[AbstractSet[bytes]] = None,
+) -> Iterator[bytes]:
+    """
+    Yield the raw VEVENT blocks (BEGIN:VEVENT to END:VEVENT) of an iCalendar document.
+    
+    VTIMEZONE blocks are parsed with icalendar on the way, because it resolves
+    custom TZIDs from them. RFC 5545 allows a VTIMEZONE after the events that
+    use it, so events referring to a custom TZID not defined yet are held
+    back until the end of the calendar. Everything else (VTODO, VJOURNAL, X-
+    components, ...) is skipped line by line.
+    
+    Args:
+        data: Raw .ics content, or an iterable of its lines (such as a file
+            opened in binary mode) to avoid holding the whole file in memory
+        start: If given, events whose raw DTEND (or DTSTART) date is clearly
+            before it are dropped without being parsed
+        end: If given, events whose raw DTSTART date is clearly after it are
+            dropped without being parsed
+        properties: If given, VEVENT blocks keep only these (uppercase)
+            properties and no subcomponents, so icalendar never parses
+            attendees, alarms and the like
+    
+    Returns:
+        Iterator of raw VEVENT blocks (not necessarily in document order)
+    
+    Raises:
+        ValueError: If the data contains no VCALENDAR
+    """
+    first_date = (start - _DATE_SLACK).strftime("%Y%m%d").encode() if start else None
+    last_date = (end + _DATE_SLACK).strftime("%Y%m%d").encode() if end else None
+    
+    seen_calendar = False
+    block: List[bytes] = []
+    block_name = None  # b"VEVENT" or b"VTIMEZONE" while inside a block
+    depth = 0  # components nested inside the current block (VALARM, STANDARD, ...)
+    skip = False
+    keep = True  # whether the last content line went into the block
+    start_date = end_date = None  # raw YYYYMMDD of the current VEVENT
+    tzids: Set[str] = set()  # TZIDs of the VTIMEZONE blocks read so far
+    pending: List[bytes] = []  # VEVENT blocks waiting for their VTIMEZONE
+    
+    lines = iter(data.splitlines(keepends=True) if isinstance(data, bytes) else data)
+    
+    # Windows exports often start with a UTF-8 byte order mark
+    first = next(lines, b"")
+    if first.startswith(codecs.BOM_UTF8):
+        first = first[len(codecs.BOM_UTF8):]
+    
+    for line in chain((first,), lines):
+        # Folded continuation lines start with whitespace and never open or
+        # close a component
+        if line[:1] in (b" ", b"\t"):
+            if block_name and keep:
+                block.append(line)
+            continue
+        
+        upper = line.rstrip().upper()
+        
+        if block_name is None:
+            if upper == b"BEGIN:VEVENT" or upper == b"BEGIN:VTIMEZONE":
+                block_name = upper[6:]
+                block = [line]
+                depth = 0
+                skip = False
+                keep = True
+                start_date = end_date = None
+            elif upper == b"BEGIN:VCALENDAR":
+                seen_calendar = True
+            elif upper == b"END:VCALENDAR" and pending:
+                yield from pending
+                pending = []
+            continue
+        
+        # Only VEVENT blocks are trimmed; VTIMEZONE blocks are kept whole
+        trim = properties is not None and block_name == b"VEVENT"
+        keep = not trim
+        
+        if upper.startswith(b"BEGIN:"):
+            depth += 1
+        elif upper.startswith(b"END:"):
+            if depth:
+                depth -= 1
+            elif upper[4:] == block_name:
+                # Events that ended before the range are only known once the
+                # whole block (and its DTEND) has been read
+                ends_on = end_date or start_date
+                if first_date is not None and ends_on is not None and ends_on < first_date:
+                    skip = True
+                if not skip:
+                    block.append(line)
+                    if block_name == b"VEVENT":
+                        vevent = b"".join(block)
+                        if _needs_pending_timezone(vevent, tzids):
+                            pending.append(vevent)
+                        else:
+                            yield vevent
+                    else:
+                        # Parsing a VTIMEZONE registers its TZID with icalendar
+                        tzid = Timezone.from_ical(b"".join(block)).get("TZID")
+                        if tzid is not None:
+                            tzids.add(str(tzid))
+                block_name = None
+                block = []
+                continue
+        elif depth == 0 and block_name == b"VEVENT":
+            # Property name without parameters
+            name = upper.split(b":", 1)[0].split(b";", 1)[0]
+            if trim:
+                keep = name in properties
+            if name == b"DTSTART" or name == b"DTEND":
+                # The date leads the value (YYYYMMDD or YYYYMMDDTHHMMSS)
+                value = upper.rsplit(b":", 1)[-1][:8]
+                # A value folded onto the next line is not compared
+                if len(value) != 8 or not value.isdigit():
+                    pass
+                elif name == b"DTEND":
+                    end_date = value
+                else:
+                    start_date = value
+                    # Short-circuit events that start after the range
+                    if last_date is not None and value > last_date:
+                        skip = True
+                        block = []
+        
+        keep = keep and not skip
+        if keep:
+            block.append(line)
+    
+    if not seen_calendar:
+        raise ValueError("No VCALENDAR found in iCal data")
+    
+    # Unterminated calendar, or TZIDs that were never defined
+    yield from pending
+
+
+def _needs_pending_timezone(block: bytes, tzids: AbstractSet[str]) -> bool:
+    """Whether a VEVENT uses a non-IANA TZID whose VTIMEZONE has not been read yet."""
+    if b"TZID" not in block and b"tzid" not in block:
+        return False
+    for tzid in _TZID_PARAM_RE.findall(_UNFOLD_RE.sub(b"", block)):
+        name = tzid.decode("utf-8", "replace")
+        if _zone(name) is None and name not in tzids:
+            return True
+    return False
+
+
+def parse_vevent(
+    component,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[CalendarEvent]:
+    """
+    Parse a VEVENT component into a CalendarEvent.
+    
+    When start and end are given, events that do not overlap the range are
+    rejected right after their times are read, before the text fields are
+    converted and scanned for hashtags.
+    
+    Returns None for events without a start, outside the range, or that
+    fail to parse.
+    """
+    try:
+        # Get start/end times
+        dtstart = component.get("dtstart")
+        dtend = component.get("dtend")
+        
+        if dtstart is None:
+            return None
+        
+        start_dt = normalize_dt(dtstart.dt)
+        
+        if dtend is not None:
+            end_dt = normalize_dt(dtend.dt)
+        else:
+            # If no end time, assume 1 hour duration
+            end_dt = start_dt + _ONE_HOUR
+        
+        if start is not None and end is not None and not (start_dt <= end and end_dt >= start):
+            return None
+        
+        # Get summary
+        summary = str(component.get("summary", "No Title"))
+        
+        # Get description
+        description = component.get("description")
+        if description:
+            description = str(description)
+        
+        # Get location
+        location = component.get("location")
+        if location:
+            location = str(location)
+        
+        # Get UID
+        uid = component.get("uid")
+        if uid:
+            uid = str(uid)
+        
+        return CalendarEvent(
+            summary=summary,
+            start=start_dt,
+            end=end_dt,
+            description=description,
+            location=location,
+            uid=uid,
+        )
+    
+    except Exception:
+        # Skip malformed events
+        return None
+
+
+def parse_vevent_block(
+    block: bytes,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[CalendarEvent]:
+    """
+    Parse a raw VEVENT block into a CalendarEvent, normally without icalendar.
+    
+    Reads only the EVENT_PROPERTIES, in the plain forms feeds use: TEXT
+    values, and DATE / DATE-TIME values that are floating, UTC or carry an
+    IANA TZID. Blocks with anything else (quoted parameters, repeated
+    properties, other TZIDs, ...) are handed to icalendar and parse_vevent,
+    so results match the icalendar path.
+    
+    Returns None like parse_vevent does.
+    """
+    try:
+        properties = _read_properties(block)
+    except ValueError:
+        properties = None
+    if properties is None:
+        return parse_vevent(Event.from_ical(block), start, end)
+    
+    dtstart = properties.get("DTSTART")
+    dtend = properties.get("DTEND")
+    try:
+        start_dt = _parse_dt(*dtstart) if dtstart is not None else None
+        end_dt = _parse_dt(*dtend) if dtend is not None else None
+    except ValueError:
+        start_dt = None
+    if start_dt is None or (dtend is not None and end_dt is None):
+        return parse_vevent(Event.from_ical(block), start, end)
+    
+    if end_dt is None:
+        # If no end time, assume 1 hour duration
+        end_dt = start_dt + _ONE_HOUR
+    
+    if start is not None and end is not None and not (start_dt <= end and end_dt >= start):
+        return None
+    
+    summary = _text(properties.get("SUMMARY"))
+    description = _text(properties.get("DESCRIPTION"))
+    
+    return CalendarEvent(
+        summary="No Title" if summary is None else summary,
+        start=start_dt,
+        end=end_dt,
+        description=description,
+        location=_text(properties.get("LOCATION")),
+        uid=_text(properties.get("UID")),
+    )
+
+
+# RFC 5545 line folding: a line break followed by one space or tab
+_UNFOLD_RE = re.compile(rb"\r?\n[ \t]")
+
+# TEXT escapes, undone in a single pass so an escaped backslash never pairs
+# with the character after it (same pattern as icalendar's unescape_backslash)
+_UNESCAPE_RE = re.compile(r"\\([\\,;:nN])")
+
+_EVENT_PROPERTY_NAMES = frozenset(name.decode() for name in EVENT_PROPERTIES)
+
+
+def _read_properties(block: bytes) -> Optional[Dict[str, Tuple[List[str], str]]]:
+    """
+    Split a VEVENT block into {name: (parameters, raw value)} for EVENT_PROPERTIES.
+    
+    Returns None when the block needs icalendar's full parser.
+    """
+    text = _UNFOLD_RE.sub(b"", block).decode("utf-8", "replace")
+    
+    properties: Dict[str, Tuple[List[str], str]] = {}
+    depth = 0
+    for line in text.split("\n"):
+        line = line.rstrip("\r")
+        if not line:
+            continue
+        
+        head, sep, value = line.partition(":")
+        if not sep:
+            return None
+        name, *params = head.split(";")
+        name = name.upper()
+        
+        # Skip the properties of nested components such as VALARM
+        if name == "BEGIN":
+            depth += 1
+        elif name == "END":
+            depth -= 1
+        elif depth == 1 and name in _EVENT_PROPERTY_NAMES:
+            # Quoted parameter values may contain ':' or ';'
+            if '"' in head or name in properties:
+                return None
+            properties[name] = (params, value)
+    
+    return properties
+
+
+def _unescape(match: "re.Match[str]") -> str:
+    """Replace one TEXT escape sequence."""
+    char = match.group(1)
+    return "\n" if char in "nN" else char
+
+
+def _text(prop: Optional[Tuple[List[str], str]]) -> Optional[str]:
+    """Unescape a TEXT value the way icalendar does."""
+    if prop is None:
+        return None
+    return _UNESCAPE_RE.sub(_unescape, prop[1])
+
+
+def _parse_dt(params: List[str], value: str) -> Optional[datetime]:
+    """
+    Parse a DATE or DATE-TIME value into a normalized local datetime.
+    
+    Returns None for forms left to icalendar.
+    """
+    tzid = None
+    for param in params:
+        key, _, param_value = param.partition("=")
+        key = key.upper()
+        if key == "TZID":
+            tzid = param_value
+        elif key == "VALUE" and param_value.upper() not in ("DATE", "DATE-TIME"):
+            return None
+    
+    # Values with surrounding whitespace fail the length checks and go to
+    # icalendar, which rejects them
+    if len(value) == 8 and value.isdigit():
+        return normalize_dt(date(int(value[:4]), int(value[4:6]), int(value[6:])))
+    
+    if len(value) not in (15, 16) or value[8] != "T":
+        return None
+    if not (value[:8].isdigit() and value[9:15].isdigit()):
+        return None
+    dt = datetime(
+        int(value[:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15]),
+    )
+    if len(value) == 16:
+        if value[15] != "Z":
+            return None
+        return normalize_dt(dt.replace(tzinfo=timezone.utc))
+    if tzid is not None:
+        zone = _zone(tzid)
+        if zone is None:
+            return None
+        dt = dt.replace(tzinfo=zone)
+    return normalize_dt(dt)
+
+
+@lru_cache(maxsize=None)
+def _zone(tzid: str) -> Optional[tzinfo]:
+    """Look up an IANA timezone; None for names only icalendar can resolve."""
+    try:
+        return ZoneInfo(tzid)
+    except Exception:
+        return None
+
+
+# Feeds repeat the same DTSTART/DTEND values (recurring slots, all-day dates);
+# the results are immutable, so normalized values are shared between events.
+
+@lru_cache(maxsize=4096)
+def normalize_dt(dt: Union[date, datetime]) -> datetime:
+    """
+    Normalize an icalendar date or datetime to a local, timezone-aware datetime.
+    
+    Dates become local midnight, naive datetimes get the local timezone and
+    aware ones are converted to it.
+    """
+    # A plain date (datetime is a date subclass) becomes local midnight
+    if type(dt) is date:
+        return datetime.combine(dt, time.min).replace(tzinfo=_LOCAL_TZ)
+    
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=_LOCAL_TZ)
+    return dt.astimezone(_LOCAL_TZ)
@@ -1,15 +1,15 @@
 """Google Calendar API fetcher using OAuth2 authentication."""
 
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union
 
 from dateutil import parser as date_parser
-from dateutil.tz import tzlocal
 
+from cal_exporter._common import LOCAL_TZ as _LOCAL_TZ
 from cal_exporter.models import CalendarEvent
-from cal_exporter.filters import extract_hashtags
 
 
 # Google API imports
@@ -23,6 +23,9 @@ except ImportError:
     GOOGLE_API_AVAILABLE = False
 
 
+# Default duration for events without an end time
+_ONE_HOUR = timedelta(hours=1)
+
 # OAuth2 scopes required for reading calendar events
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
@@ -30,6 +33,12 @@ SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 DEFAULT_CREDENTIALS_FILE = "credentials.json"
 DEFAULT_TOKEN_FILE = "token.json"
 
+# Largest page the events.list endpoint accepts (the default is 250)
+MAX_RESULTS = 2500
+
+# Only request the fields _parse_event reads
+EVENT_FIELDS = "items(id,summary,description,location,start,end),nextPageToken"
+
 
 class GoogleAPIFetcher:
     """Fetch events from Google Calendar using the API."""
@@ -132,6 +141,8 @@ class GoogleAPIFetcher:
                 timeMax=time_max,
                 singleEvents=True,
                 orderBy="startTime",
+                maxResults=MAX_RESULTS,
+                fields=EVENT_FIELDS,
                 pageToken=page_token,
             ).execute()
             
@@ -168,7 +179,7 @@ class GoogleAPIFetcher:
                 end_dt = self._parse_datetime(end_str)
             else:
                 # Default to 1 hour duration
-                end_dt = start_dt.replace(hour=start_dt.hour + 1)
+                end_dt = start_dt + _ONE_HOUR
             
             # Get description
             description = item.get("description")
@@ -179,9 +190,6 @@ class GoogleAPIFetcher:
             # Get UID
             uid = item.get("id")
             
-            # Extract hashtags from description
-            hashtags = extract_hashtags(description)
-            
             return CalendarEvent(
                 summary=summary,
                 start=start_dt,
@@ -189,7 +197,6 @@ class GoogleAPIFetcher:
                 description=description,
                 location=location,
                 uid=uid,
-                hashtags=hashtags,
             )
             
         except Exception:
@@ -197,10 +204,27 @@ class GoogleAPIFetcher:
     
     def _parse_datetime(self, dt_string: str) -> datetime:
         """Parse a datetime string from the Google Calendar API."""
-        local_tz = tzlocal()
+        return _parse_iso(dt_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(dt_string: str) -> datetime:
+    """
+    Parse an API timestamp into a timezone-aware datetime.
+    
+    Cached by the raw string: recurring events repeat the same timestamps and
+    datetimes are immutable, so parsed values can be shared between events.
+    """
+    # The API returns RFC 3339 / ISO 8601, so the strict parser almost
+    # always succeeds; dateutil is only a fallback for anything unusual.
+    # fromisoformat() only accepts a trailing "Z" from Python 3.11 on.
+    try:
+        dt = datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+    except ValueError:
         dt = date_parser.parse(dt_string)
-        
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=local_tz)
-        
-        return dt
+    
+    # All-day events only carry a date; treat them as local time
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_LOCAL_TZ)
+    
+    return dt
@@ -1,14 +1,26 @@
 """iCal URL fetcher for public calendar feeds."""
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, List, Optional
 
 import requests
-from icalendar import Calendar
-from dateutil.tz import tzlocal, tzutc
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from cal_exporter.fetchers._ical_common import (
+    EVENT_PROPERTIES,
+    iter_vevent_blocks,
+    parse_vevent_block,
+)
 from cal_exporter.models import CalendarEvent
-from cal_exporter.filters import extract_hashtags
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Retry transient gateway errors instead of failing the whole export
+_RETRY = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
 
 
 class ICalFetcher:
@@ -24,6 +36,22 @@ class ICalFetcher:
         """
         self.url = url
         self.timeout = timeout
+        
+        # Reuse connections (and their TLS handshakes) across fetches
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+    
+    def __enter__(self) -> "ICalFetcher":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def fetch(self, start: datetime, end: datetime) -> List[CalendarEvent]:
         """
@@ -37,103 +65,82 @@ class ICalFetcher:
             List of CalendarEvent objects
         """
         # Fetch the iCal data
-        response = requests.get(self.url, timeout=self.timeout)
+        response = self._session.get(self.url, timeout=self.timeout)
         response.raise_for_status()
         
-        # Parse the calendar
-        cal = Calendar.from_ical(response.content)
+        return self._events_in_range(response.content, start, end)
+    
+    async def fetch_async(
+        self,
+        start: datetime,
+        end: datetime,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ) -> List[CalendarEvent]:
+        """
+        Fetch events like fetch(), without blocking the event loop.
         
-        events = []
-        local_tz = tzlocal()
+        Requires aiohttp (pip install cal-exporter[async]).
         
-        for component in cal.walk():
-            if component.name != "VEVENT":
-                continue
-            
-            event = self._parse_event(component, local_tz)
-            if event is None:
-                continue
+        Args:
+            start: Start of date range
+            end: End of date range
+            session: aiohttp session to reuse; a temporary one is created if omitted
             
-            # Filter by date range
-            if event.start <= end and event.end >= start:
+        Returns:
+            List of CalendarEvent objects
+        """
+        import aiohttp
+        
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.fetch_async(start, end, session)
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with session.get(self.url, timeout=timeout) as response:
+            response.raise_for_status()
+            content = await response.read()
+        
+        return self._events_in_range(content, start, end)
+    
+    def _events_in_range(self, content: bytes, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """Parse iCal data into sorted events overlapping the date range."""
+        events = []
+        
+        # Only VEVENT blocks are read; events clearly outside the range are
+        # dropped before they are parsed
+        for block in iter_vevent_blocks(content, start, end, EVENT_PROPERTIES):
+            # Events outside the date range come back as None
+            event = parse_vevent_block(block, start, end)
+            if event is not None:
                 events.append(event)
         
         # Sort by start time
         events.sort(key=lambda e: e.start)
         
         return events
+
+
+def fetch_all(fetchers: List[ICalFetcher], start: datetime, end: datetime) -> List[CalendarEvent]:
+    """
+    Fetch several iCal feeds concurrently over one aiohttp session.
     
-    def _parse_event(self, component, local_tz) -> Optional[CalendarEvent]:
-        """Parse a VEVENT component into a CalendarEvent."""
-        try:
-            # Get summary
-            summary = str(component.get("summary", "No Title"))
-            
-            # Get start/end times
-            dtstart = component.get("dtstart")
-            dtend = component.get("dtend")
-            
-            if dtstart is None:
-                return None
-            
-            start_dt = self._normalize_datetime(dtstart.dt, local_tz)
-            
-            if dtend is not None:
-                end_dt = self._normalize_datetime(dtend.dt, local_tz)
-            else:
-                # If no end time, assume 1 hour duration
-                end_dt = start_dt.replace(hour=start_dt.hour + 1)
-            
-            # Get description
-            description = component.get("description")
-            if description:
-                description = str(description)
-            
-            # Get location
-            location = component.get("location")
-            if location:
-                location = str(location)
-            
-            # Get UID
-            uid = component.get("uid")
-            if uid:
-                uid = str(uid)
-            
-            # Extract hashtags from description
-            hashtags = extract_hashtags(description)
-            
-            return CalendarEvent(
-                summary=summary,
-                start=start_dt,
-                end=end_dt,
-                description=description,
-                location=location,
-                uid=uid,
-                hashtags=hashtags,
-            )
-            
-        except Exception:
-            # Skip malformed events
-            return None
+    Requires aiohttp (pip install cal-exporter[async]).
     
-    def _normalize_datetime(self, dt, local_tz) -> datetime:
-        """
-        Normalize a datetime value to a timezone-aware datetime.
-        
-        Handles both date and datetime objects from icalendar.
-        """
-        from datetime import date, time
+    Args:
+        fetchers: iCal fetchers to download from
+        start: Start of date range
+        end: End of date range
         
-        # If it's a date (not datetime), convert to datetime at midnight
-        if not isinstance(dt, datetime):
-            if isinstance(dt, date):
-                dt = datetime.combine(dt, time.min)
-        
-        # Add timezone if missing
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=local_tz)
-        else:
-            # Convert to local timezone for consistency
-            dt = dt.astimezone(local_tz)
-        
-        return dt
+    Returns:
+        Events from all feeds, sorted by start time
+    """
+    import aiohttp
+    
+    async def gather():
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(
+                *(fetcher.fetch_async(start, end, session) for fetcher in fetchers)
+            )
+    
+    results = asyncio.run(gather())
+    return sorted(chain.from_iterable(results), key=lambda e: e.start)
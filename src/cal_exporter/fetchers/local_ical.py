@@ -1,14 +1,18 @@
 """Local iCal file fetcher."""
 
+import heapq
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional
-
-from icalendar import Calendar
-from dateutil.tz import tzlocal
+from typing import List, Optional, Sequence
 
+from cal_exporter.fetchers._ical_common import (
+    EVENT_PROPERTIES,
+    iter_vevent_blocks,
+    parse_vevent_block,
+)
 from cal_exporter.models import CalendarEvent
-from cal_exporter.filters import extract_hashtags
 
 
 class LocalICalFetcher:
@@ -38,101 +42,65 @@ class LocalICalFetcher:
         Returns:
             List of CalendarEvent objects
         """
-        # Read the iCal file
-        with open(self.file_path, "rb") as f:
-            cal = Calendar.from_ical(f.read())
-        
         events = []
-        local_tz = tzlocal()
         
-        for component in cal.walk():
-            if component.name != "VEVENT":
-                continue
-            
-            event = self._parse_event(component, local_tz)
-            if event is None:
-                continue
-            
-            # Filter by date range
-            if event.start <= end and event.end >= start:
-                events.append(event)
+        # Stream the file line by line instead of reading it into one bytes
+        # object. Only VEVENT blocks are read; events clearly outside the
+        # range are dropped before they are parsed
+        with open(self.file_path, "rb") as f:
+            for block in iter_vevent_blocks(f, start, end, EVENT_PROPERTIES):
+                # Events outside the date range come back as None
+                event = parse_vevent_block(block, start, end)
+                if event is not None:
+                    events.append(event)
         
         # Sort by start time
         events.sort(key=lambda e: e.start)
         
         return events
+
+
+def _fetch_file(file_path: str, start: datetime, end: datetime) -> List[CalendarEvent]:
+    """Fetch one file; module-level so worker processes can unpickle it."""
+    return LocalICalFetcher(file_path).fetch(start, end)
+
+
+class MultiFileFetcher:
+    """Fetch and merge events from several local .ics files in parallel."""
     
-    def _parse_event(self, component, local_tz) -> Optional[CalendarEvent]:
-        """Parse a VEVENT component into a CalendarEvent."""
-        try:
-            # Get summary
-            summary = str(component.get("summary", "No Title"))
-            
-            # Get start/end times
-            dtstart = component.get("dtstart")
-            dtend = component.get("dtend")
-            
-            if dtstart is None:
-                return None
-            
-            start_dt = self._normalize_datetime(dtstart.dt, local_tz)
-            
-            if dtend is not None:
-                end_dt = self._normalize_datetime(dtend.dt, local_tz)
-            else:
-                # If no end time, assume 1 hour duration
-                end_dt = start_dt.replace(hour=start_dt.hour + 1)
-            
-            # Get description
-            description = component.get("description")
-            if description:
-                description = str(description)
-            
-            # Get location
-            location = component.get("location")
-            if location:
-                location = str(location)
-            
-            # Get UID
-            uid = component.get("uid")
-            if uid:
-                uid = str(uid)
-            
-            # Extract hashtags from description
-            hashtags = extract_hashtags(description)
-            
-            return CalendarEvent(
-                summary=summary,
-                start=start_dt,
-                end=end_dt,
-                description=description,
-                location=location,
-                uid=uid,
-                hashtags=hashtags,
-            )
-            
-        except Exception:
-            # Skip malformed events
-            return None
-    
-    def _normalize_datetime(self, dt, local_tz) -> datetime:
+    def __init__(self, file_paths: Sequence[str], max_workers: Optional[int] = None):
         """
-        Normalize a datetime value to a timezone-aware datetime.
+        Initialize the multi-file fetcher.
         
-        Handles both date and datetime objects from icalendar.
+        Args:
+            file_paths: Paths to the local .ics files
+            max_workers: Worker processes to use (default: one per CPU)
         """
-        from datetime import date, time
+        # Validate every path up front, like LocalICalFetcher does
+        self.file_paths = [str(LocalICalFetcher(path).file_path) for path in file_paths]
+        self.max_workers = max_workers
+    
+    def fetch(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """
+        Fetch events from all files within the date range.
         
-        # If it's a date (not datetime), convert to datetime at midnight
-        if not isinstance(dt, datetime):
-            if isinstance(dt, date):
-                dt = datetime.combine(dt, time.min)
+        Parsing is CPU-bound, so files are spread over worker processes
+        rather than threads.
         
-        # Add timezone if missing
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=local_tz)
+        Args:
+            start: Start of date range
+            end: End of date range
+            
+        Returns:
+            List of CalendarEvent objects from all files, sorted by start time
+        """
+        if len(self.file_paths) < 2:
+            results = [_fetch_file(path, start, end) for path in self.file_paths]
         else:
-            # Convert to local timezone for consistency
-            dt = dt.astimezone(local_tz)
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(
+                    executor.map(_fetch_file, self.file_paths, repeat(start), repeat(end))
+                )
         
-        return dt
+        # Each file's events are already sorted
+        return list(heapq.merge(*results, key=lambda e: e.start))
@@ -2,13 +2,20 @@
 
 import re
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from functools import lru_cache, reduce
+from typing import Dict, List, Set, Tuple
 
 from dateutil import parser as date_parser
-from dateutil.tz import tzlocal
 
+from cal_exporter._common import LOCAL_TZ as _LOCAL_TZ
+from cal_exporter._common import extract_hashtags
 from cal_exporter.models import CalendarEvent
 
+# A date or datetime, a colon, and another date or datetime
+_RANGE_RE = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2})?):(\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2})?)$"
+)
+
 
 def parse_date_range(date_string: str) -> Tuple[datetime, datetime]:
     """
@@ -24,10 +31,9 @@ def parse_date_range(date_string: str) -> Tuple[datetime, datetime]:
         Tuple of (start_datetime, end_datetime)
     """
     date_string = date_string.strip()
-    local_tz = tzlocal()
     
     if date_string.lower() == "today":
-        today = datetime.now(local_tz).replace(hour=0, minute=0, second=0, microsecond=0)
+        today = datetime.now(_LOCAL_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
         return today, today.replace(hour=23, minute=59, second=59)
     
     # Check for range separator
@@ -54,10 +60,11 @@ def _split_date_range(date_string: str) -> List[str]:
     - "2026-02-01:2026-02-28" -> ["2026-02-01", "2026-02-28"]
     - "2026-02-01T09:00:2026-02-01T17:00" -> ["2026-02-01T09:00", "2026-02-01T17:00"]
     """
-    # Pattern to match date or datetime followed by : and another date/datetime
-    # Look for the pattern where we have a date, then :, then another date
-    pattern = r'^(\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2})?):(\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2})?)$'
-    match = re.match(pattern, date_string)
+    # Common case: two plain dates, YYYY-MM-DD:YYYY-MM-DD
+    if len(date_string) == 21 and date_string[10] == ":" and date_string.count(":") == 1:
+        return [date_string[:10], date_string[11:]]
+    
+    match = _RANGE_RE.match(date_string)
     
     if match:
         return [match.group(1), match.group(2)]
@@ -74,14 +81,16 @@ def _parse_single_date(date_string: str, is_start: bool = True) -> datetime:
         date_string: The date string to parse
         is_start: If True, defaults time to 00:00:00, otherwise 23:59:59
     """
-    local_tz = tzlocal()
-    
     try:
-        dt = date_parser.parse(date_string)
+        # CLI dates are almost always ISO 8601; dateutil handles anything else
+        try:
+            dt = datetime.fromisoformat(date_string)
+        except ValueError:
+            dt = date_parser.parse(date_string)
         
         # If no timezone, assume local
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=local_tz)
+            dt = dt.replace(tzinfo=_LOCAL_TZ)
         
         # If only date was provided (no time component in string), set appropriate time
         if "T" not in date_string and " " not in date_string:
@@ -96,30 +105,11 @@ def _parse_single_date(date_string: str, is_start: bool = True) -> datetime:
         raise ValueError(f"Invalid date format: {date_string}. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM") from e
 
 
-def extract_hashtags(text: Optional[str]) -> List[str]:
-    """
-    Extract hashtags from text.
-    
-    Args:
-        text: Text to search for hashtags
-        
-    Returns:
-        List of hashtags found (including the # symbol)
-    """
-    if not text:
-        return []
-    
-    # Match hashtags: # followed by word characters
-    pattern = r'#\w+'
-    return re.findall(pattern, text, re.IGNORECASE)
-
-
+@lru_cache(maxsize=1024)
 def _normalize_hashtag(tag: str) -> str:
     """Normalize a single hashtag (ensure it starts with #, lowercase)."""
-    tag = tag.strip()
-    if not tag.startswith("#"):
-        tag = f"#{tag}"
-    return tag.lower()
+    tag = tag.strip().lower()
+    return tag if tag.startswith("#") else f"#{tag}"
 
 
 def _parse_hashtag_groups(hashtags: List[str]) -> List[set]:
@@ -175,26 +165,25 @@ def filter_events(
     # Parse hashtags into AND groups (OR between groups)
     hashtag_groups = _parse_hashtag_groups(hashtags)
     
-    filtered = []
-    for event in events:
-        # Extract hashtags from description
-        event_hashtags = extract_hashtags(event.description)
-        event_hashtags_lower = {t.lower() for t in event_hashtags}
-        
-        # Check if any AND group is fully satisfied (OR between groups)
-        matches = False
-        for and_group in hashtag_groups:
-            # All hashtags in the group must be present (AND logic)
-            if and_group.issubset(event_hashtags_lower):
-                matches = True
-                break
-        
-        if matches:
-            # Update the event with its hashtags
-            event.hashtags = event_hashtags
-            filtered.append(event)
+    wanted = set().union(*hashtag_groups)
     
-    return filtered
+    # Inverted index of the searched tags: tag -> positions of events carrying it
+    index: Dict[str, Set[int]] = {}
+    for i, event in enumerate(events):
+        # CalendarEvent lowercases its hashtags (or extracts them from the
+        # description) when it is built
+        for tag in event.hashtags:
+            if tag in wanted:
+                index.setdefault(tag, set()).add(i)
+    
+    # Intersect within each AND group, union across the OR groups
+    empty: Set[int] = set()
+    matches: Set[int] = set()
+    for and_group in hashtag_groups:
+        matches |= reduce(set.intersection, (index.get(tag, empty) for tag in and_group))
+    
+    # Keep the original event order
+    return [events[i] for i in sorted(matches)]
 
 
 def filter_by_date_range(
@@ -215,3 +204,34 @@ def filter_by_date_range(
             filtered.append(event)
     
     return filtered
+
+
+def filter_by_date_range_np(
+    events: List[CalendarEvent],
+    start: datetime,
+    end: datetime,
+) -> List[CalendarEvent]:
+    """
+    Vectorized filter_by_date_range for large event lists.
+    
+    Compares POSIX microsecond timestamps in NumPy arrays instead of
+    datetimes one by one. Falls back to filter_by_date_range when NumPy
+    is not installed (it ships with the "speedups" extra).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return filter_by_date_range(events, start, end)
+    
+    count = len(events)
+    starts = np.fromiter(
+        (round(e.start.timestamp() * 1_000_000) for e in events), dtype=np.int64, count=count
+    )
+    ends = np.fromiter(
+        (round(e.end.timestamp() * 1_000_000) for e in events), dtype=np.int64, count=count
+    )
+    start_us = round(start.timestamp() * 1_000_000)
+    end_us = round(end.timestamp() * 1_000_000)
+    
+    mask = (starts <= end_us) & (ends >= start_us)
+    return [events[i] for i in np.flatnonzero(mask)]
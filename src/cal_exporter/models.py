@@ -1,13 +1,28 @@
 """Data models for calendar events."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from cal_exporter._common import extract_hashtags
 
-@dataclass
+# Slotted instances drop the per-event __dict__; slots=True needs Python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Sets fields on frozen instances (derived values and their caches)
+_set = object.__setattr__
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class CalendarEvent:
-    """Represents a calendar event with relevant fields for export."""
+    """
+    Represents a calendar event with relevant fields for export.
+    
+    Hashtags are stored lowercased; when none are given they are extracted
+    from the description. Events are frozen because derived values are
+    computed once and cached; use dataclasses.replace() to change a field.
+    """
     
     summary: str
     start: datetime
@@ -17,19 +32,67 @@ class CalendarEvent:
     uid: Optional[str] = None
     hashtags: List[str] = field(default_factory=list)
     
+    # Derived values: the duration is computed at construction, the export
+    # strings on first access (and then reused by every exporter)
+    _duration_hours: float = field(init=False, repr=False, compare=False)
+    _duration_formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _date_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _start_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _hashtag_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if self.hashtags:
+            _set(self, "hashtags", [tag.lower() for tag in self.hashtags])
+        else:
+            _set(self, "hashtags", extract_hashtags(self.description))
+        _set(self, "_duration_hours", (self.end - self.start).total_seconds() / 3600)
+    
     @property
     def duration_hours(self) -> float:
-        """Calculate event duration in hours."""
-        delta = self.end - self.start
-        return delta.total_seconds() / 3600
+        """Event duration in hours."""
+        return self._duration_hours
     
     @property
     def duration_formatted(self) -> str:
         """Format duration as HH:MM."""
-        total_minutes = int(self.duration_hours * 60)
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
-        return f"{hours}:{minutes:02d}"
+        if self._duration_formatted is None:
+            hours, minutes = divmod(int(self._duration_hours * 60), 60)
+            _set(self, "_duration_formatted", f"{hours}:{minutes:02d}")
+        return self._duration_formatted
+    
+    @property
+    def date_str(self) -> str:
+        """Start date as YYYY-MM-DD."""
+        if self._date_str is None:
+            _set(self, "_date_str", self.start.strftime("%Y-%m-%d"))
+        return self._date_str
+    
+    @property
+    def start_str(self) -> str:
+        """Start time as HH:MM."""
+        if self._start_str is None:
+            _set(self, "_start_str", self.start.strftime("%H:%M"))
+        return self._start_str
+    
+    @property
+    def end_str(self) -> str:
+        """End time as HH:MM."""
+        if self._end_str is None:
+            _set(self, "_end_str", self.end.strftime("%H:%M"))
+        return self._end_str
+    
+    @property
+    def hashtag_str(self) -> str:
+        """Hashtags joined into one comma-separated string."""
+        if self._hashtag_str is None:
+            _set(self, "_hashtag_str", ", ".join(self.hashtags))
+        return self._hashtag_str
+    
+    @property
+    def duration_rounded(self) -> float:
+        """Duration in hours rounded to two decimals."""
+        return round(self._duration_hours, 2)
     
     def to_dict(self) -> Dict[str, str]:
         """Convert event to dictionary for export."""
@@ -37,9 +100,47 @@ class CalendarEvent:
             "summary": self.summary,
             "start": self.start.isoformat(),
             "end": self.end.isoformat(),
-            "duration_hours": round(self.duration_hours, 2),
+            "duration_hours": self.duration_rounded,
+            "duration_formatted": self.duration_formatted,
+            "description": self.description or "",
+            "location": self.location or "",
+            "hashtags": self.hashtag_str,
+        }
+    
+    def to_jsonable(self) -> Dict[str, Any]:
+        """
+        Like to_dict, but with start/end left as datetimes.
+        
+        For encoders that serialize datetimes natively (orjson), which skips
+        building the ISO strings in Python.
+        """
+        return {
+            "summary": self.summary,
+            "start": self.start,
+            "end": self.end,
+            "duration_hours": self.duration_rounded,
             "duration_formatted": self.duration_formatted,
             "description": self.description or "",
             "location": self.location or "",
-            "hashtags": ", ".join(self.hashtags),
+            "hashtags": self.hashtag_str,
         }
+    
+    def to_row_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert event to a tuple of tabular export values.
+        
+        Values follow the exporters' column order: date, start time, end time,
+        rounded duration, formatted duration, summary, description, location
+        and hashtags.
+        """
+        return (
+            self.date_str,
+            self.start_str,
+            self.end_str,
+            self.duration_rounded,
+            self.duration_formatted,
+            self.summary,
+            self.description or "",
+            self.location or "",
+            self.hashtag_str,
+        )
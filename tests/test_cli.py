@@ -93,6 +93,20 @@ class TestCLI:
         assert result.exit_code == 0
         assert output_file.exists()
     
+    def test_export_multiple_formats(self, runner, test_ics_path, tmp_path):
+        """CLI should write one file per requested format."""
+        output_file = tmp_path / "report"
+        result = runner.invoke(main, [
+            "-l", test_ics_path,
+            "-d", "2026-02-01:2026-02-05",
+            "-w", str(output_file),
+            "-e", "csv",
+            "-e", "json",
+        ])
+        assert result.exit_code == 0
+        assert (tmp_path / "report.csv").exists()
+        assert (tmp_path / "report.json").exists()
+    
     def test_infer_format_from_extension(self, runner, test_ics_path, tmp_path):
         """CLI should infer export format from file extension."""
         output_file = tmp_path / "output.csv"
@@ -104,3 +118,63 @@ class TestCLI:
         ])
         assert result.exit_code == 0
         assert output_file.exists()
+    
+    def test_missing_export_library(self, runner, test_ics_path, tmp_path, monkeypatch):
+        """A missing export backend should be reported as an unavailable format."""
+        import builtins
+        
+        real_import = builtins.__import__
+        
+        def fake_import(name, *args, **kwargs):
+            if name.startswith("openpyxl"):
+                raise ImportError("No module named 'openpyxl'")
+            return real_import(name, *args, **kwargs)
+        
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        result = runner.invoke(main, [
+            "-l", test_ics_path,
+            "-d", "2026-02-01:2026-02-05",
+            "-w", str(tmp_path / "output.xlsx"),
+        ])
+        assert result.exit_code != 0
+        assert "Export format 'xlsx' is not available" in result.output
+    
+    def test_ical_url_uses_ical_fetcher(self):
+        """iCal feed URLs should be routed to the iCal fetcher."""
+        from cal_exporter.cli import get_fetcher
+        from cal_exporter.fetchers import ICalFetcher
+        
+        for url in [
+            "https://calendar.google.com/calendar/ical/abc/public/basic.ics",
+            "http://example.com/feeds/iCal?id=1",
+        ]:
+            assert isinstance(get_fetcher(url), ICalFetcher)
+
+
+class TestStaticHelp:
+    """Tests for the --help/--version fast path in the console-script entry."""
+    
+    def test_help_skips_cli_import(self, monkeypatch, capsys):
+        """--help should be answered from the static text."""
+        from cal_exporter.__main__ import run
+        monkeypatch.setattr("sys.argv", ["cal-exporter", "--help"])
+        with pytest.raises(SystemExit) as exc_info:
+            run()
+        assert exc_info.value.code == 0
+        assert "Export Google Calendar events" in capsys.readouterr().out
+    
+    def test_version(self, monkeypatch, capsys):
+        """--version should print the package version."""
+        from cal_exporter import __version__
+        from cal_exporter.__main__ import run
+        monkeypatch.setattr("sys.argv", ["cal-exporter", "--version"])
+        with pytest.raises(SystemExit):
+            run()
+        assert __version__ in capsys.readouterr().out
+    
+    def test_static_help_lists_every_option(self):
+        """The static help text must not drift from the click options."""
+        from cal_exporter.__main__ import STATIC_HELP
+        for param in main.params:
+            for opt in param.opts:
+                assert opt in STATIC_HELP
@@ -107,3 +107,128 @@ class TestJSONExporter:
         assert data["events"][0]["summary"] == "Event 1"
         assert data["summary"]["total_events"] == 1
         assert data["summary"]["total_hours"] == 2.0
+    
+    def test_json_export_compact_by_default(self, sample_events, tmp_path):
+        """JSON exporter should write compact output unless pretty is set."""
+        compact_file = tmp_path / "compact.json"
+        pretty_file = tmp_path / "pretty.json"
+        
+        JSONExporter = get_json_exporter()
+        JSONExporter(str(compact_file)).export(sample_events)
+        JSONExporter(str(pretty_file), pretty=True).export(sample_events)
+        
+        assert "\n" not in compact_file.read_text()
+        assert "\n  " in pretty_file.read_text()
+        assert json.loads(compact_file.read_text()) == json.loads(pretty_file.read_text())
+    
+    def test_json_export_without_orjson(self, sample_events, tmp_path, monkeypatch):
+        """JSON exporter should fall back to the stdlib encoder."""
+        from cal_exporter.exporters import json_export
+        monkeypatch.setattr(json_export, "orjson", None)
+        
+        output_file = tmp_path / "output.json"
+        json_export.JSONExporter(str(output_file)).export(sample_events)
+        
+        data = json.loads(output_file.read_text())
+        assert data["events"][0]["summary"] == "Event 1"
+        assert data["summary"]["total_hours"] == 2.0
+
+
+class TestXLSXExporter:
+    """Tests for XLSX export functionality."""
+    
+    @pytest.fixture
+    def sample_events(self):
+        """Create sample events for export testing."""
+        local_tz = tzlocal()
+        return [
+            CalendarEvent(
+                summary=f"Event {i}",
+                start=datetime(2026, 2, 1, 9 + i, 0, tzinfo=local_tz),
+                end=datetime(2026, 2, 1, 10 + i, 30, tzinfo=local_tz),
+                hashtags=["#billable"],
+            )
+            for i in range(3)
+        ]
+    
+    def _read_rows(self, path):
+        from openpyxl import load_workbook
+        ws = load_workbook(path).active
+        return [list(row) for row in ws.iter_rows(values_only=True)]
+    
+    def test_write_only_matches_standard(self, sample_events, tmp_path, monkeypatch):
+        """Streaming mode should produce the same cell values as the standard mode."""
+        from cal_exporter.exporters import xlsx_export
+        
+        standard = tmp_path / "standard.xlsx"
+        xlsx_export.XLSXExporter(str(standard)).export(sample_events)
+        
+        monkeypatch.setattr(xlsx_export, "WRITE_ONLY_THRESHOLD", 1)
+        streamed = tmp_path / "streamed.xlsx"
+        xlsx_export.XLSXExporter(str(streamed)).export(sample_events)
+        
+        rows = self._read_rows(standard)
+        assert rows == self._read_rows(streamed)
+        assert rows[1][5] == "Event 0"
+        assert rows[-1] == ["Total Hours:", 4.5] + [None] * 7
+
+
+class TestODSExporter:
+    """Tests for ODS export functionality."""
+    
+    def test_ods_export_content(self, tmp_path):
+        """ODS exporter should write headers, rows and typed numeric cells."""
+        from odf import teletype
+        from odf.opendocument import load
+        from odf.table import TableCell, TableRow
+        from odf.text import LineBreak
+        from cal_exporter.exporters import get_ods_exporter
+        
+        local_tz = tzlocal()
+        events = [
+            CalendarEvent(
+                summary="Event 1",
+                start=datetime(2026, 2, 1, 9, 0, tzinfo=local_tz),
+                end=datetime(2026, 2, 1, 10, 30, tzinfo=local_tz),
+                description="First line\nSecond line",
+            ),
+        ]
+        output_file = tmp_path / "output.ods"
+        ODSExporter = get_ods_exporter()
+        ODSExporter(str(output_file)).export(events)
+        
+        rows = load(str(output_file)).spreadsheet.getElementsByType(TableRow)
+        cells = [row.getElementsByType(TableCell) for row in rows]
+        assert teletype.extractText(cells[0][0]) == "Date"
+        assert teletype.extractText(cells[1][5]) == "Event 1"
+        assert cells[1][3].getAttribute("valuetype") == "float"
+        assert cells[1][3].getAttribute("value") == "1.5"
+        assert cells[1][6].getElementsByType(LineBreak)
+        assert len(cells[2]) == 1
+
+
+class TestTerminalExporter:
+    """Tests for terminal output."""
+    
+    def test_plain_output_when_not_a_tty(self, capsys):
+        """Redirected output should be tab-separated lines, with totals on stderr."""
+        from cal_exporter.exporters import get_terminal_exporter
+        
+        local_tz = tzlocal()
+        events = [
+            CalendarEvent(
+                summary="Event\t1\nnotes",
+                start=datetime(2026, 2, 1, 9, 0, tzinfo=local_tz),
+                end=datetime(2026, 2, 1, 11, 0, tzinfo=local_tz),
+                hashtags=["#billable", "#client"],
+            ),
+        ]
+        TerminalExporter = get_terminal_exporter()
+        TerminalExporter().export(events)
+        
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == [
+            "Date\tTime\tDuration\tSummary\tHashtags",
+            "2026-02-01\t09:00 - 11:00\t2:00\tEvent 1 notes\t#billable, #client",
+        ]
+        assert captured.err.splitlines()[-1] == "Total hours: 2.00"
@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from dateutil.tz import tzlocal
 
-from cal_exporter.fetchers import LocalICalFetcher
+from cal_exporter.fetchers import ICalFetcher, LocalICalFetcher, MultiFileFetcher
 
 
 class TestLocalICalFetcher:
@@ -85,6 +85,74 @@ class TestLocalICalFetcher:
         with pytest.raises(ValueError, match=".ics extension"):
             LocalICalFetcher(str(bad_file))
     
+    def test_missing_end_defaults_to_one_hour(self, tmp_path):
+        """Events without DTEND should last an hour, even across midnight."""
+        ics = tmp_path / "late.ics"
+        ics.write_bytes(
+            b"BEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART:20260201T233000\r\n"
+            b"SUMMARY:Late call\r\n"
+            b"END:VEVENT\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 1, 0, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 2, 23, 59, tzinfo=local_tz)
+        
+        events = LocalICalFetcher(str(ics)).fetch(start, end)
+        assert len(events) == 1
+        assert events[0].end == datetime(2026, 2, 2, 0, 30, tzinfo=local_tz)
+    
+    def test_vtimezone_after_its_events(self, tmp_path):
+        """A custom VTIMEZONE placed after the events using it should still apply."""
+        from datetime import timezone
+        
+        ics = tmp_path / "zones.ics"
+        ics.write_bytes(
+            b"BEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART;TZID=Test Zone After Events:20260201T090000\r\n"
+            b"DTEND;TZID=Test Zone After Events:20260201T100000\r\n"
+            b"SUMMARY:Zoned\r\n"
+            b"END:VEVENT\r\n"
+            b"BEGIN:VTIMEZONE\r\n"
+            b"TZID:Test Zone After Events\r\n"
+            b"BEGIN:STANDARD\r\n"
+            b"DTSTART:19700101T000000\r\n"
+            b"TZOFFSETFROM:+0500\r\n"
+            b"TZOFFSETTO:+0500\r\n"
+            b"END:STANDARD\r\n"
+            b"END:VTIMEZONE\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        local_tz = tzlocal()
+        start = datetime(2026, 1, 31, 0, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 2, 23, 59, tzinfo=local_tz)
+        
+        events = LocalICalFetcher(str(ics)).fetch(start, end)
+        assert len(events) == 1
+        assert events[0].start == datetime(2026, 2, 1, 4, 0, tzinfo=timezone.utc)
+        assert events[0].duration_hours == 1.0
+    
+    def test_byte_order_mark(self, tmp_path):
+        """Files starting with a UTF-8 byte order mark should load."""
+        ics = tmp_path / "bom.ics"
+        ics.write_bytes(
+            b"\xef\xbb\xbfBEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART:20260201T090000\r\n"
+            b"SUMMARY:Outlook export\r\n"
+            b"END:VEVENT\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 1, 0, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 1, 23, 59, tzinfo=local_tz)
+        
+        events = LocalICalFetcher(str(ics)).fetch(start, end)
+        assert [e.summary for e in events] == ["Outlook export"]
+    
     def test_fetcher_events_sorted_by_start(self, fetcher):
         """Events should be sorted by start time."""
         local_tz = tzlocal()
@@ -94,3 +162,327 @@ class TestLocalICalFetcher:
         events = fetcher.fetch(start, end)
         for i in range(len(events) - 1):
             assert events[i].start <= events[i + 1].start
+
+
+class TestMultiFileFetcher:
+    """Tests for fetching several local .ics files at once."""
+    
+    def test_merges_files_sorted_by_start(self, tmp_path):
+        source = Path(__file__).parent / "test_calendar.ics"
+        paths = []
+        for name in ("a.ics", "b.ics"):
+            path = tmp_path / name
+            path.write_bytes(source.read_bytes())
+            paths.append(str(path))
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 1, 0, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 28, 23, 59, tzinfo=local_tz)
+        
+        events = MultiFileFetcher(paths, max_workers=2).fetch(start, end)
+        assert len(events) == 16
+        assert [e.start for e in events] == sorted(e.start for e in events)
+    
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            MultiFileFetcher([str(tmp_path / "missing.ics")])
+
+
+class TestIterVeventBlocks:
+    """Tests for the VEVENT-only iCal reader shared by the fetchers."""
+    
+    ICS = (
+        b"BEGIN:VCALENDAR\r\n"
+        b"VERSION:2.0\r\n"
+        b"BEGIN:VTODO\r\n"
+        b"SUMMARY:Not an event\r\n"
+        b"END:VTODO\r\n"
+        b"BEGIN:VEVENT\r\n"
+        b"DTSTART:20260201T090000\r\n"
+        b"DTEND:20260201T100000\r\n"
+        b"SUMMARY:Folded\r\n"
+        b"  summary\r\n"
+        b"BEGIN:VALARM\r\n"
+        b"TRIGGER:-PT15M\r\n"
+        b"END:VALARM\r\n"
+        b"END:VEVENT\r\n"
+        b"BEGIN:VEVENT\r\n"
+        b"DTSTART;VALUE=DATE:20260601\r\n"
+        b"SUMMARY:Much later\r\n"
+        b"END:VEVENT\r\n"
+        b"END:VCALENDAR\r\n"
+    )
+    
+    def events(self, **kwargs):
+        from icalendar import Event
+        from cal_exporter.fetchers._ical_common import iter_vevent_blocks
+        
+        return [Event.from_ical(block) for block in iter_vevent_blocks(self.ICS, **kwargs)]
+    
+    def test_yields_only_events(self):
+        events = self.events()
+        assert [str(e["summary"]) for e in events] == ["Folded summary", "Much later"]
+        assert events[0].subcomponents[0].name == "VALARM"
+    
+    def test_keeps_only_requested_properties(self):
+        events = self.events(properties={b"SUMMARY", b"DTSTART"})
+        assert str(events[0]["summary"]) == "Folded summary"
+        assert "dtend" not in events[0]
+        assert events[0].subcomponents == []
+    
+    def test_skips_events_starting_after_end(self):
+        events = self.events(end=datetime(2026, 2, 28))
+        assert [str(e["summary"]) for e in events] == ["Folded summary"]
+    
+    def test_skips_events_ending_before_start(self):
+        events = self.events(start=datetime(2026, 5, 1))
+        assert [str(e["summary"]) for e in events] == ["Much later"]
+    
+    def test_keeps_events_from_zones_ahead_of_local_time(self):
+        from cal_exporter.fetchers._ical_common import iter_vevent_blocks
+        
+        # 2026-02-01 23:30 in Pacific/Pago_Pago (UTC-11)
+        ics = (
+            b"BEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART;TZID=Pacific/Kiritimati:20260203T003000\r\n"
+            b"END:VEVENT\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        end = datetime(2026, 2, 1, 23, 59, 59)
+        assert len(list(iter_vevent_blocks(ics, end=end))) == 1
+    
+    def test_keeps_events_from_zones_behind_local_time(self):
+        from cal_exporter.fetchers._ical_common import iter_vevent_blocks
+        
+        # Ends 2026-02-01 00:30 in Pacific/Kiritimati (UTC+14)
+        ics = (
+            b"BEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART;TZID=Pacific/Pago_Pago:20260130T223000\r\n"
+            b"DTEND;TZID=Pacific/Pago_Pago:20260130T233000\r\n"
+            b"END:VEVENT\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        assert len(list(iter_vevent_blocks(ics, start=datetime(2026, 2, 1)))) == 1
+    
+    def test_keeps_events_with_folded_dtstart(self):
+        from cal_exporter.fetchers._ical_common import iter_vevent_blocks
+        
+        ics = (
+            b"BEGIN:VCALENDAR\r\n"
+            b"BEGIN:VEVENT\r\n"
+            b"DTSTART:2026\r\n"
+            b" 0301T090000\r\n"
+            b"END:VEVENT\r\n"
+            b"END:VCALENDAR\r\n"
+        )
+        assert len(list(iter_vevent_blocks(ics, start=datetime(2026, 2, 1)))) == 1
+    
+    def test_rejects_non_calendar_data(self):
+        from cal_exporter.fetchers._ical_common import iter_vevent_blocks
+        
+        with pytest.raises(ValueError):
+            list(iter_vevent_blocks(b"<html>Not found</html>"))
+
+
+class TestParseVeventBlock:
+    """Tests for the VEVENT parser that bypasses icalendar."""
+    
+    def block(self, *lines):
+        return b"".join(line + b"\r\n" for line in (b"BEGIN:VEVENT", *lines, b"END:VEVENT"))
+    
+    def parse(self, *lines):
+        from cal_exporter.fetchers._ical_common import parse_vevent_block
+        
+        return parse_vevent_block(self.block(*lines))
+    
+    def assert_matches_icalendar(self, *lines):
+        from icalendar import Event
+        from cal_exporter.fetchers._ical_common import parse_vevent, parse_vevent_block
+        
+        block = self.block(*lines)
+        event = parse_vevent_block(block)
+        assert event == parse_vevent(Event.from_ical(block))
+        return event
+    
+    def test_text_values_are_unescaped_and_unfolded(self):
+        event = self.parse(
+            b"DTSTART:20260201T090000",
+            b"SUMMARY:Sync\\, notes\\; more",
+            # Folded in the middle of the two-byte UTF-8 sequence for "\u00e9"
+            b"DESCRIPTION:Caf\xc3",
+            b" \xa9 #Billable",
+            b"BEGIN:VALARM",
+            b"DESCRIPTION:Reminder #alarm",
+            b"END:VALARM",
+        )
+        assert event.summary == "Sync, notes; more"
+        assert event.description == "Caf\u00e9 #Billable"
+        assert event.hashtags == ["#billable"]
+    
+    def test_escaped_backslashes_match_icalendar(self):
+        event = self.assert_matches_icalendar(
+            b"DTSTART:20260201T090000",
+            b"SUMMARY:a\\:b",
+            b"DESCRIPTION:C:\\\\new",
+            b"LOCATION:\\\\\\\\srv\\\\share",
+        )
+        assert event.summary == "a:b"
+        assert event.description == "C:\\new"
+        assert event.location == "\\\\srv\\share"
+    
+    def test_padded_datetime_matches_icalendar(self):
+        assert self.assert_matches_icalendar(b"DTSTART:20260201T090000 ") is None
+    
+    def test_utc_and_tzid_times(self):
+        utc = self.parse(b"DTSTART:20260201T090000Z", b"DTEND:20260201T100000Z")
+        zoned = self.parse(
+            b"DTSTART;TZID=Europe/Amsterdam:20260201T100000",
+            b"DTEND;TZID=Europe/Amsterdam:20260201T110000",
+        )
+        assert utc.start == zoned.start
+        assert zoned.duration_hours == 1.0
+    
+    def test_all_day_event(self):
+        event = self.parse(b"DTSTART;VALUE=DATE:20260201", b"DTEND;VALUE=DATE:20260202")
+        assert (event.start.hour, event.duration_hours) == (0, 24.0)
+        assert event.summary == "No Title"
+    
+    def test_falls_back_to_icalendar_for_unknown_tzid(self):
+        event = self.parse(
+            b"DTSTART;TZID=W. Europe Standard Time:20260201T100000",
+            b'SUMMARY;X-NOTE="a:b":Quoted',
+        )
+        assert event.summary == "Quoted"
+        assert event.start.utcoffset() is not None
+
+
+class TestICalFetcher:
+    """Tests for the iCal URL fetcher, with the HTTP session faked."""
+    
+    @pytest.fixture
+    def fetcher(self, monkeypatch):
+        """Create a fetcher whose session serves the test .ics file."""
+        content = (Path(__file__).parent / "test_calendar.ics").read_bytes()
+        requested = []
+        
+        class FakeResponse:
+            def __init__(self):
+                self.content = content
+            
+            def raise_for_status(self):
+                pass
+        
+        def fake_get(url, timeout):
+            requested.append(url)
+            return FakeResponse()
+        
+        fetcher = ICalFetcher("https://example.com/basic.ics")
+        monkeypatch.setattr(fetcher._session, "get", fake_get)
+        fetcher.requested = requested
+        return fetcher
+    
+    def test_fetch_reuses_session(self, fetcher):
+        """Repeated fetches should go through the fetcher's own session."""
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 1, 0, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 28, 23, 59, tzinfo=local_tz)
+        
+        with fetcher:
+            assert len(fetcher.fetch(start, end)) == 8
+            assert len(fetcher.fetch(start, end)) == 8
+        assert fetcher.requested == ["https://example.com/basic.ics"] * 2
+    
+    def test_fetch_all_concurrently(self):
+        """fetch_all should download every feed and merge events by start."""
+        pytest.importorskip("aiohttp")
+        import threading
+        from functools import partial
+        from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+        
+        from cal_exporter.fetchers import fetch_all
+        
+        handler = partial(SimpleHTTPRequestHandler, directory=str(Path(__file__).parent))
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/test_calendar.ics"
+            local_tz = tzlocal()
+            start = datetime(2026, 2, 1, 0, 0, tzinfo=local_tz)
+            end = datetime(2026, 2, 28, 23, 59, tzinfo=local_tz)
+            
+            events = fetch_all([ICalFetcher(url), ICalFetcher(url)], start, end)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(events) == 16
+        assert [e.start for e in events] == sorted(e.start for e in events)
+
+
+class TestGoogleAPIFetcher:
+    """Tests for parsing Google Calendar API items."""
+    
+    @pytest.fixture
+    def fetcher(self):
+        """Create a fetcher without touching credentials or the network."""
+        pytest.importorskip("googleapiclient")
+        from cal_exporter.fetchers import get_google_api_fetcher
+        GoogleAPIFetcher = get_google_api_fetcher()
+        return GoogleAPIFetcher.__new__(GoogleAPIFetcher)
+    
+    def test_parse_datetime_with_offset(self, fetcher):
+        dt = fetcher._parse_datetime("2026-02-01T09:00:00+01:00")
+        assert dt.hour == 9
+        assert dt.utcoffset().total_seconds() == 3600
+    
+    def test_parse_datetime_utc_suffix(self, fetcher):
+        dt = fetcher._parse_datetime("2026-02-01T09:00:00Z")
+        assert dt.hour == 9
+        assert dt.utcoffset().total_seconds() == 0
+    
+    def test_parse_all_day_date_is_local(self, fetcher):
+        dt = fetcher._parse_datetime("2026-02-01")
+        assert (dt.year, dt.month, dt.day, dt.hour) == (2026, 2, 1, 0)
+        assert dt.tzinfo is not None
+    
+    def test_parse_event_without_end_at_late_hour(self, fetcher):
+        event = fetcher._parse_event({
+            "id": "late",
+            "summary": "Late call",
+            "start": {"dateTime": "2026-02-01T23:30:00+01:00"},
+        })
+        assert event is not None
+        assert event.duration_hours == 1.0
+    
+    def test_fetch_requests_large_pages_and_field_mask(self, fetcher):
+        calls = []
+        
+        class FakeRequest:
+            def __init__(self, result):
+                self.result = result
+            
+            def execute(self):
+                return self.result
+        
+        class FakeEvents:
+            def list(self, **kwargs):
+                calls.append(kwargs)
+                if kwargs["pageToken"] is None:
+                    return FakeRequest({"items": [], "nextPageToken": "next"})
+                return FakeRequest({"items": []})
+        
+        class FakeService:
+            def events(self):
+                return FakeEvents()
+        
+        fetcher.calendar_id = "primary"
+        fetcher._service = FakeService()
+        fetcher.fetch(datetime(2026, 2, 1), datetime(2026, 2, 28))
+        
+        assert len(calls) == 2
+        assert calls[1]["pageToken"] == "next"
+        for kwargs in calls:
+            assert kwargs["maxResults"] == 2500
+            assert "nextPageToken" in kwargs["fields"]
@@ -8,6 +8,8 @@ from cal_exporter.filters import (
     parse_date_range,
     extract_hashtags,
     filter_events,
+    filter_by_date_range,
+    filter_by_date_range_np,
     _parse_hashtag_groups,
     _normalize_hashtag,
 )
@@ -27,6 +29,11 @@ class TestExtractHashtags:
         result = extract_hashtags(text)
         assert result == ["#project", "#client", "#billable"]
     
+    def test_extract_lowercases_hashtags(self):
+        text = "Sync #Billable #ZZP"
+        result = extract_hashtags(text)
+        assert result == ["#billable", "#zzp"]
+    
     def test_extract_no_hashtags(self):
         text = "This has no hashtags"
         result = extract_hashtags(text)
@@ -97,6 +104,11 @@ class TestParseDateRange:
         assert start.day == 1
         assert end.day == 28
     
+    def test_parse_datetime_range(self):
+        start, end = parse_date_range("2026-02-01T09:00:2026-02-01T17:30")
+        assert (start.hour, start.minute) == (9, 0)
+        assert (end.hour, end.minute) == (17, 30)
+    
     def test_invalid_date_raises_error(self):
         with pytest.raises(ValueError):
             parse_date_range("not-a-date")
@@ -181,3 +193,48 @@ class TestFilterEvents:
         """Hashtags without # prefix should still work."""
         result = filter_events(sample_events, ["billable"])
         assert len(result) == 2
+    
+    def test_filter_mixed_case_event_hashtags(self):
+        """Hashtags passed in by the caller should match regardless of case."""
+        local_tz = tzlocal()
+        event = CalendarEvent(
+            summary="Event",
+            start=datetime(2026, 2, 1, 9, 0, tzinfo=local_tz),
+            end=datetime(2026, 2, 1, 10, 0, tzinfo=local_tz),
+            description="#Billable work",
+            hashtags=["#Billable"],
+        )
+        assert filter_events([event], ["billable"]) == [event]
+
+
+class TestFilterByDateRange:
+    """Tests for date range overlap filtering."""
+    
+    @pytest.fixture
+    def events(self):
+        local_tz = tzlocal()
+        return [
+            CalendarEvent(
+                summary=f"Event {day}",
+                start=datetime(2026, 2, day, 9, 0, tzinfo=local_tz),
+                end=datetime(2026, 2, day, 17, 0, tzinfo=local_tz),
+            )
+            for day in range(1, 11)
+        ]
+    
+    def test_overlapping_events_included(self, events):
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 3, 17, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 5, 9, 0, tzinfo=local_tz)
+        
+        result = filter_by_date_range(events, start, end)
+        assert [e.summary for e in result] == ["Event 3", "Event 4", "Event 5"]
+    
+    def test_numpy_version_matches(self, events):
+        pytest.importorskip("numpy")
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 3, 17, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 5, 9, 0, tzinfo=local_tz)
+        
+        assert filter_by_date_range_np(events, start, end) == filter_by_date_range(events, start, end)
+        assert filter_by_date_range_np([], start, end) == []
@@ -1,5 +1,7 @@
 """Tests for the data models."""
 
+import sys
+
 import pytest
 from datetime import datetime
 from dateutil.tz import tzlocal
@@ -42,6 +44,14 @@ class TestCalendarEvent:
         )
         assert event.duration_formatted == "3:00"
     
+    def test_export_strings(self, sample_event):
+        """Formatted export strings should match the event fields."""
+        assert sample_event.date_str == "2026-02-01"
+        assert sample_event.start_str == "09:00"
+        assert sample_event.end_str == "10:30"
+        assert sample_event.hashtag_str == "#billable, #client"
+        assert sample_event.duration_rounded == 1.5
+    
     def test_to_dict(self, sample_event):
         """Event should convert to dictionary correctly."""
         result = sample_event.to_dict()
@@ -52,6 +62,30 @@ class TestCalendarEvent:
         assert result["location"] == "Conference Room"
         assert "#billable" in result["hashtags"]
     
+    def test_to_jsonable_keeps_datetimes(self, sample_event):
+        """to_jsonable should match to_dict apart from the raw datetimes."""
+        result = sample_event.to_jsonable()
+        
+        assert result["start"] is sample_event.start
+        assert result["end"] is sample_event.end
+        expected = sample_event.to_dict()
+        del expected["start"], expected["end"], result["start"], result["end"]
+        assert result == expected
+    
+    def test_to_row_tuple(self, sample_event):
+        """Row tuples should hold the tabular export values in column order."""
+        assert sample_event.to_row_tuple() == (
+            "2026-02-01",
+            "09:00",
+            "10:30",
+            1.5,
+            "1:30",
+            "Test Meeting",
+            "A test meeting #billable #client",
+            "Conference Room",
+            "#billable, #client",
+        )
+    
     def test_to_dict_empty_optional_fields(self):
         """Dictionary should handle None optional fields."""
         local_tz = tzlocal()
@@ -74,3 +108,32 @@ class TestCalendarEvent:
             end=datetime(2026, 2, 1, 10, 0, tzinfo=local_tz),
         )
         assert event.hashtags == []
+    
+    def test_hashtags_are_normalized(self):
+        """Given hashtags are lowercased; missing ones come from the description."""
+        local_tz = tzlocal()
+        start = datetime(2026, 2, 1, 9, 0, tzinfo=local_tz)
+        end = datetime(2026, 2, 1, 10, 0, tzinfo=local_tz)
+        given = CalendarEvent(summary="Test", start=start, end=end, hashtags=["#Billable"])
+        extracted = CalendarEvent(
+            summary="Test", start=start, end=end, description="Call #Client #work"
+        )
+        assert given.hashtags == ["#billable"]
+        assert extracted.hashtags == ["#client", "#work"]
+    
+    def test_events_are_frozen(self, sample_event):
+        """Cached derived values must not go stale, so fields cannot be reassigned."""
+        import dataclasses
+        
+        assert sample_event.end_str == sample_event.end.strftime("%H:%M")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_event.end = sample_event.start
+        
+        moved = dataclasses.replace(sample_event, end=sample_event.start)
+        assert moved.duration_hours == 0.0
+        assert moved.end_str == sample_event.start_str
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need Python 3.10")
+    def test_events_are_slotted(self, sample_event):
+        """Events should not carry a per-instance __dict__."""
+        assert not hasattr(sample_event, "__dict__")